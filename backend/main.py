@@ -6,6 +6,7 @@ This module sets up the app and mounts routers - all endpoint logic is in router
 """
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
@@ -15,6 +16,7 @@ from fastapi.staticfiles import StaticFiles
 
 import models
 from database import engine
+from utils import email as email_service
 
 # Import routers
 from routers import auth, groups, members, expenses, balances, friends, ocr, profile, password_recovery, oauth, summary
@@ -28,11 +30,22 @@ DATA_DIR = os.getenv("DATA_DIR", "data")
 RECEIPT_DIR = os.path.join(DATA_DIR, "receipts")
 os.makedirs(RECEIPT_DIR, exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start background email delivery workers
+    email_service.start_workers()
+    yield
+    # Drain pending emails, then release the pooled HTTP connections
+    await email_service.stop_workers()
+    await email_service.close_client()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Splitwiser API",
     description="API for expense splitting and group management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount static files for receipts
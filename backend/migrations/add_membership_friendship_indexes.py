@@ -0,0 +1,67 @@
+"""
+Migration: Add composite unique indexes for membership and friendship lookups
+Creates covering indexes on group_members(group_id, user_id) and
+friendships(user_id1, user_id2) so the hot existence checks in
+utils/validation.py become index-only scans. Run canonicalize_friendships
+first so the friendship index's uniqueness holds.
+"""
+
+import sqlite3
+import os
+
+def run_migration():
+    # Find the database
+    db_path = os.path.join(os.path.dirname(__file__), '..', 'db.sqlite3')
+    if not os.path.exists(db_path):
+        db_path = '/data/db.sqlite3'  # Production path
+
+    if not os.path.exists(db_path):
+        print("Error: Database file not found")
+        return False
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # Remove duplicate memberships so the unique index can be created;
+        # keep the oldest row of each (group_id, user_id) pair.
+        cursor.execute("""
+            DELETE FROM group_members
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM group_members GROUP BY group_id, user_id
+            )
+        """)
+        if cursor.rowcount:
+            print(f"✓ Removed {cursor.rowcount} duplicate membership rows")
+
+        print("Creating index on group_members(group_id, user_id)...")
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_group_members_group_user
+            ON group_members(group_id, user_id)
+        """)
+        print("✓ Created idx_group_members_group_user")
+
+        print("Creating index on friendships(user_id1, user_id2)...")
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_friendships_user1_user2
+            ON friendships(user_id1, user_id2)
+        """)
+        print("✓ Created idx_friendships_user1_user2")
+
+        conn.commit()
+        print("\n✅ Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        print(f"Error running migration: {e}")
+        conn.rollback()
+        return False
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    run_migration()
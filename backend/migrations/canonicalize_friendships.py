@@ -0,0 +1,65 @@
+"""
+Migration: Canonicalize friendship row order
+Rewrites friendships so user_id1 < user_id2 on every row, letting
+existence checks use a single equality lookup instead of querying both
+directions. Also removes duplicate rows where both directions were stored.
+"""
+
+import sqlite3
+import os
+
+def run_migration():
+    # Find the database
+    db_path = os.path.join(os.path.dirname(__file__), '..', 'db.sqlite3')
+    if not os.path.exists(db_path):
+        db_path = '/data/db.sqlite3'  # Production path
+
+    if not os.path.exists(db_path):
+        print("Error: Database file not found")
+        return False
+
+    print(f"Using database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # Swap any rows stored in reverse order. SQLite evaluates the
+        # right-hand sides against the old row, so a simultaneous swap is safe.
+        cursor.execute("SELECT COUNT(*) FROM friendships WHERE user_id1 > user_id2")
+        reversed_count = cursor.fetchone()[0]
+        print(f"Rows stored in reverse order: {reversed_count}")
+
+        cursor.execute("""
+            UPDATE friendships
+            SET user_id1 = user_id2, user_id2 = user_id1
+            WHERE user_id1 > user_id2
+        """)
+        print(f"✓ Canonicalized {cursor.rowcount} rows")
+
+        # A pair stored in both directions collapses to two identical rows
+        # after the swap; keep the oldest of each pair.
+        cursor.execute("""
+            DELETE FROM friendships
+            WHERE id NOT IN (
+                SELECT MIN(id) FROM friendships GROUP BY user_id1, user_id2
+            )
+        """)
+        if cursor.rowcount:
+            print(f"✓ Removed {cursor.rowcount} duplicate rows")
+
+        conn.commit()
+        print("\n✅ Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        print(f"Error running migration: {e}")
+        conn.rollback()
+        return False
+
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from database import Base
 from datetime import datetime
 
@@ -32,6 +32,11 @@ class Group(Base):
 
 class GroupMember(Base):
     __tablename__ = "group_members"
+    # Covering index so is_group_member / verify_group_membership existence
+    # checks are index-only; unique because a user joins a group once.
+    __table_args__ = (
+        Index("idx_group_members_group_user", "group_id", "user_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     group_id = Column(Integer)
@@ -52,11 +57,25 @@ class GuestMember(Base):
 
 class Friendship(Base):
     __tablename__ = "friendships"
+    # Covering index for is_friend's canonical-pair lookup; rows are stored
+    # with user_id1 < user_id2, so one direction is enough.
+    __table_args__ = (
+        Index("idx_friendships_user1_user2", "user_id1", "user_id2", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id1 = Column(Integer)
+    user_id1 = Column(Integer)  # Always the lower of the pair (canonical order)
     user_id2 = Column(Integer)
 
+    @staticmethod
+    def canonical_pair(user_id_a: int, user_id_b: int) -> tuple[int, int]:
+        """Order a pair of user ids as stored: user_id1 < user_id2.
+
+        Rows are written canonically so existence checks are a single
+        equality lookup instead of an OR over both directions.
+        """
+        return (user_id_a, user_id_b) if user_id_a < user_id_b else (user_id_b, user_id_a)
+
 class Expense(Base):
     __tablename__ = "expenses"
 
@@ -1,5 +1,6 @@
 """Balances router: balance calculations and debt simplification."""
 
+from itertools import groupby
 from typing import Annotated, Dict, List, Tuple
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
@@ -10,7 +11,7 @@ from database import get_db
 from dependencies import get_current_user
 from utils.validation import get_group_or_404, verify_group_membership
 from utils.display import get_guest_display_name
-from utils.balances import calculate_net_balances
+from utils.balances import calculate_net_balances, calculate_net_balances_batch
 from utils.currency import (
     format_currency,
     convert_to_usd,
@@ -52,39 +53,38 @@ def get_group_balances(
     # We need to recalculate raw balances for breakdown display
     manager_guest_breakdown = {}
 
-    # Get all expenses to recalculate raw balances for breakdown
-    expenses = db.query(models.Expense).filter(models.Expense.group_id == group_id).all()
-
-    # Optimization: Batch fetch splits for all expenses
-    expense_ids = [e.id for e in expenses]
-    splits_by_expense = {}
-    if expense_ids:
-        all_splits = db.query(models.ExpenseSplit).filter(
-            models.ExpenseSplit.expense_id.in_(expense_ids)
-        ).all()
-        for split in all_splits:
-            if split.expense_id not in splits_by_expense:
-                splits_by_expense[split.expense_id] = []
-            splits_by_expense[split.expense_id].append(split)
+    # Recalculate raw balances for breakdown by streaming one joined query:
+    # each split row carries the expense columns it needs, so there is no
+    # expense list, no splits dict-of-lists, and yield_per caps Python-side
+    # memory at one driver batch regardless of group size. Amounts are
+    # integer cents, so accumulation order doesn't affect the totals.
+    split_rows = db.query(
+        models.ExpenseSplit.user_id,
+        models.ExpenseSplit.is_guest,
+        models.ExpenseSplit.amount_owed,
+        models.Expense.currency,
+        models.Expense.payer_id,
+        models.Expense.payer_is_guest,
+    ).join(
+        models.Expense, models.ExpenseSplit.expense_id == models.Expense.id
+    ).filter(models.Expense.group_id == group_id).yield_per(2000)
 
     raw_balances = {}  # (user_id, is_guest) -> {currency -> amount}
 
-    for expense in expenses:
-        splits = splits_by_expense.get(expense.id, [])
-        for split in splits:
-            key = (split.user_id, split.is_guest)
-            if key not in raw_balances:
-                raw_balances[key] = {}
-            if expense.currency not in raw_balances[key]:
-                raw_balances[key][expense.currency] = 0
-            raw_balances[key][expense.currency] -= split.amount_owed
-
-            payer_key = (expense.payer_id, expense.payer_is_guest)
-            if payer_key not in raw_balances:
-                raw_balances[payer_key] = {}
-            if expense.currency not in raw_balances[payer_key]:
-                raw_balances[payer_key][expense.currency] = 0
-            raw_balances[payer_key][expense.currency] += split.amount_owed
+    for user_id, is_guest, amount_owed, currency, payer_id, payer_is_guest in split_rows:
+        key = (user_id, is_guest)
+        if key not in raw_balances:
+            raw_balances[key] = {}
+        if currency not in raw_balances[key]:
+            raw_balances[key][currency] = 0
+        raw_balances[key][currency] -= amount_owed
+
+        payer_key = (payer_id, payer_is_guest)
+        if payer_key not in raw_balances:
+            raw_balances[payer_key] = {}
+        if currency not in raw_balances[payer_key]:
+            raw_balances[payer_key][currency] = 0
+        raw_balances[payer_key][currency] += amount_owed
 
     # Batch fetch users and guests to avoid N+1 queries during display name resolution
     user_ids_to_fetch = set()
@@ -344,22 +344,23 @@ def get_balances(
         amount_in_usd = amount / from_rate
         return amount_in_usd * to_rate
     
-    # For each group, calculate user's net balance using the same logic as Group page
-    for group_id in user_group_ids:
-        group = groups_map.get(group_id)
-        if not group:
-            continue
-            
-        group_default_currency = group.default_currency or "USD"
-        
-        # Use calculate_net_balances - same function as Group page
-        # This handles managed members, historical exchange rates, etc.
-        net_balances = calculate_net_balances(db, group_id, target_currency=group_default_currency)
-        
+    # Calculate every group's net balances in one batched pass (same logic as
+    # the Group page: managed members, historical exchange rates, etc.)
+    target_currencies = {
+        group_id: (groups_map[group_id].default_currency or "USD")
+        for group_id in user_group_ids
+        if group_id in groups_map
+    }
+    balances_by_group = calculate_net_balances_batch(db, target_currencies)
+
+    for group_id, group_default_currency in target_currencies.items():
+        group = groups_map[group_id]
+        net_balances = balances_by_group[group_id]
+
         # Find current user's balance in this group
         user_key = (current_user.id, False)  # (user_id, is_guest=False)
         user_balance = net_balances.get(user_key, 0)
-        
+
         if abs(user_balance) > 0.01:  # Skip near-zero balances
             # Determine display currency
             display_currency = convert_to if convert_to else group_default_currency
@@ -380,38 +381,57 @@ def get_balances(
     
     # Handle 1-to-1 IOUs (non-group expenses) - these are still calculated separately
     # For now, keep the existing logic for individual user balances
-    paid_expenses = db.query(models.Expense).filter(
+    # Column projections: the IOU loops only read a handful of fields, so
+    # fetch row tuples instead of instrumented ORM objects.
+    paid_expenses = db.query(
+        models.Expense.id,
+        models.Expense.currency,
+    ).filter(
         models.Expense.payer_id == current_user.id,
         models.Expense.payer_is_guest == False,
         models.Expense.group_id == None  # Only non-group expenses
     ).all()
 
-    my_splits = db.query(models.ExpenseSplit).filter(
+    my_splits = db.query(
+        models.ExpenseSplit.expense_id,
+        models.ExpenseSplit.user_id,
+        models.ExpenseSplit.is_guest,
+        models.ExpenseSplit.amount_owed,
+    ).filter(
         models.ExpenseSplit.user_id == current_user.id,
         models.ExpenseSplit.is_guest == False
     ).all()
 
     user_balances = {}  # (user_id, currency) -> amount
 
-    # Batch fetch splits for paid expenses
+    # Batch fetch splits for paid expenses, ordered so groupby can bucket
+    # adjacent runs per expense without per-row dict probes.
     paid_expense_ids = [e.id for e in paid_expenses]
-    splits_for_paid_expenses = []
+    splits_by_expense = {}
     if paid_expense_ids:
-        splits_for_paid_expenses = db.query(models.ExpenseSplit).filter(
+        splits_for_paid_expenses = db.query(
+            models.ExpenseSplit.expense_id,
+            models.ExpenseSplit.user_id,
+            models.ExpenseSplit.is_guest,
+            models.ExpenseSplit.amount_owed,
+        ).filter(
             models.ExpenseSplit.expense_id.in_(paid_expense_ids)
-        ).all()
-
-    splits_by_expense = {}
-    for split in splits_for_paid_expenses:
-        if split.expense_id not in splits_by_expense:
-            splits_by_expense[split.expense_id] = []
-        splits_by_expense[split.expense_id].append(split)
+        ).order_by(models.ExpenseSplit.expense_id).all()
+        splits_by_expense = {
+            expense_id: list(expense_splits)
+            for expense_id, expense_splits in groupby(splits_for_paid_expenses, key=lambda s: s.expense_id)
+        }
 
     # Batch fetch expenses for my_splits (only non-group)
     my_split_expense_ids = [s.expense_id for s in my_splits]
     expenses_for_my_splits = {}
     if my_split_expense_ids:
-        expenses_list = db.query(models.Expense).filter(
+        expenses_list = db.query(
+            models.Expense.id,
+            models.Expense.currency,
+            models.Expense.payer_id,
+            models.Expense.payer_is_guest,
+        ).filter(
             models.Expense.id.in_(my_split_expense_ids),
             models.Expense.group_id == None  # Only non-group
         ).all()
@@ -321,14 +321,29 @@ def get_expense(
     if not has_access:
         raise HTTPException(status_code=403, detail="You don't have access to this expense")
 
+    # Batch fetch users and guests referenced by the splits to avoid one
+    # query per split while building display names.
+    split_user_ids = {s.user_id for s in splits if not s.is_guest}
+    split_guest_ids = {s.user_id for s in splits if s.is_guest}
+
+    split_users = {}
+    if split_user_ids:
+        user_records = db.query(models.User).filter(models.User.id.in_(split_user_ids)).all()
+        split_users = {u.id: u for u in user_records}
+
+    split_guests = {}
+    if split_guest_ids:
+        guest_records = db.query(models.GuestMember).filter(models.GuestMember.id.in_(split_guest_ids)).all()
+        split_guests = {g.id: g for g in guest_records}
+
     # Build splits with user names
     splits_with_names = []
     for split in splits:
         if split.is_guest:
-            guest = db.query(models.GuestMember).filter(models.GuestMember.id == split.user_id).first()
+            guest = split_guests.get(split.user_id)
             user_name = guest.name if guest else "Unknown Guest"
         else:
-            user = db.query(models.User).filter(models.User.id == split.user_id).first()
+            user = split_users.get(split.user_id)
             user_name = (user.full_name or user.email) if user else "Unknown User"
 
         splits_with_names.append(schemas.ExpenseSplitDetail(
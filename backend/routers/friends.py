@@ -277,11 +277,11 @@ def accept_friend_request(
     if not friend_request:
         raise HTTPException(status_code=404, detail="Friend request not found")
     
-    # Create friendship
-    new_friendship = models.Friendship(
-        user_id1=friend_request.from_user_id,
-        user_id2=current_user.id
+    # Create friendship (stored in canonical order)
+    user_id1, user_id2 = models.Friendship.canonical_pair(
+        friend_request.from_user_id, current_user.id
     )
+    new_friendship = models.Friendship(user_id1=user_id1, user_id2=user_id2)
     db.add(new_friendship)
     
     # Update request status
@@ -432,7 +432,8 @@ def add_friend(
     if existing:
         raise HTTPException(status_code=400, detail="Already friends")
 
-    new_friendship = models.Friendship(user_id1=current_user.id, user_id2=friend_user.id)
+    user_id1, user_id2 = models.Friendship.canonical_pair(current_user.id, friend_user.id)
+    new_friendship = models.Friendship(user_id1=user_id1, user_id2=user_id2)
     db.add(new_friendship)
     db.commit()
 
@@ -1,6 +1,7 @@
 """Groups router: create, read, update, delete groups."""
 
 import json
+import uuid
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
@@ -231,7 +232,6 @@ def share_group(
     group = get_group_or_404(db, group_id)
 
     if not group.share_link_id:
-        import uuid
         group.share_link_id = str(uuid.uuid4())
 
     group.is_public = True
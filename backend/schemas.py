@@ -69,8 +69,8 @@ class ExpenseItemCreate(BaseModel):
     price: int  # In cents
     is_tax_tip: bool = False
     assignments: list[ItemAssignment] = []
-    split_type: Optional[str] = 'EQUAL'  # EQUAL, EXACT, PERCENT, SHARES
-    split_details: Optional[Dict[str, ItemSplitDetail]] = None  # Keyed by "user_{id}" or "guest_{id}"
+    split_type: Literal['EQUAL', 'EXACT', 'PERCENT', 'SHARES'] = 'EQUAL'
+    split_details: Dict[str, ItemSplitDetail] = Field(default_factory=dict)  # Keyed by "user_{id}" or "guest_{id}"
 
 class ExpenseItemAssignmentDetail(BaseModel):
     user_id: Optional[int] = None
@@ -90,6 +90,19 @@ def reset_summary_cache():
     summary_cache._clear_for_tests()
 
 
+@pytest.fixture(autouse=True)
+def reset_balances_cache():
+    """
+    Clear the in-memory net-balances cache between tests. The write-event
+    invalidation keeps it correct within a test, but group IDs restart from 1
+    in every fresh database, so entries must not bleed across tests.
+    """
+    from utils import balances_cache
+    balances_cache._clear_for_tests()
+    yield
+    balances_cache._clear_for_tests()
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limits():
     """Disable all rate limits during testing using dependency overrides."""
@@ -108,3 +108,66 @@ def test_get_group_expenses_n_plus_one(client, db_session, auth_headers, test_us
 
     print(f"Query count: {query_count}")
     assert query_count <= 10, f"Query count too high: {query_count}. Expected constant number of queries."
+
+
+def test_validate_participants_constant_queries(client, db_session, auth_headers, test_user):
+    """Participant validation must stay at a constant number of queries
+    regardless of how many users appear in the splits (no per-participant
+    SELECTs)."""
+    from schemas import ExpenseSplitBase
+    from utils.validation import validate_expense_participants
+
+    # 1. Setup: a group with test_user plus 19 other members
+    group = Group(name="Validation Perf Group", created_by_id=test_user.id)
+    db_session.add(group)
+    db_session.commit()
+    db_session.refresh(group)
+
+    members = [GroupMember(group_id=group.id, user_id=test_user.id)]
+    other_users = []
+    for i in range(19):
+        user = User(
+            email=f"participant{i}@example.com",
+            hashed_password="hashed_password",
+            full_name=f"Participant {i}",
+            is_active=True
+        )
+        db_session.add(user)
+        db_session.commit()
+        db_session.refresh(user)
+        other_users.append(user)
+        members.append(GroupMember(group_id=group.id, user_id=user.id))
+    db_session.add_all(members)
+    db_session.commit()
+
+    all_ids = [test_user.id] + [u.id for u in other_users]
+    splits = [
+        ExpenseSplitBase(user_id=user_id, amount_owed=100, is_guest=False)
+        for user_id in all_ids
+    ]
+
+    # 2. Measure queries for one validation call over 20 participants
+    query_count = 0
+
+    def count_queries(conn, cursor, statement, parameters, context, executemany):
+        nonlocal query_count
+        query_count += 1
+
+    event.listen(db_session.bind, "before_cursor_execute", count_queries)
+
+    validate_expense_participants(
+        db=db_session,
+        payer_id=test_user.id,
+        payer_is_guest=False,
+        splits=splits,
+        group_id=group.id,
+        current_user_id=test_user.id,
+    )
+
+    event.remove(db_session.bind, "before_cursor_execute", count_queries)
+
+    print(f"\nQueries to validate 20 participants: {query_count}")
+
+    # Per-participant lookups would put this at 40+ for 20 participants;
+    # the batched rewrite needs one users query and one memberships query.
+    assert query_count <= 4, f"Query count too high: {query_count}. Validation may have regressed to per-participant queries."
@@ -1,11 +1,14 @@
 """Balance calculation utilities with management relationship aggregation."""
 
 import logging
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, overload
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union, overload
+from sqlalchemy import func, literal, null, select, union_all
 from sqlalchemy.orm import Session
 
 import models
-from utils.currency import convert_to_usd, convert_currency
+from utils import balances_cache
+from utils.currency import EXCHANGE_RATES, convert_to_usd, convert_currency
 
 
 logger = logging.getLogger(__name__)
@@ -95,6 +98,28 @@ def _detect_managed_cycles(
     return in_cycle
 
 
+def _managed_relationship_flags(db: Session, group_id: int) -> Tuple[bool, bool]:
+    """
+    Probe whether the group has any managed guests / managed members.
+
+    Most groups have neither, so the fold paths use this single cheap
+    round-trip (two EXISTS subqueries in one SELECT) to skip fetching the
+    managed rows entirely in the common case.
+
+    Returns:
+        ``(has_managed_guests, has_managed_members)``.
+    """
+    has_managed_guests = db.query(models.GuestMember).filter(
+        models.GuestMember.group_id == group_id,
+        models.GuestMember.managed_by_id != None
+    ).exists()
+    has_managed_members = db.query(models.GroupMember).filter(
+        models.GroupMember.group_id == group_id,
+        models.GroupMember.managed_by_id != None
+    ).exists()
+    return db.query(has_managed_guests, has_managed_members).one()
+
+
 def _fold_managed_relationships(
     db: Session,
     group_id: int,
@@ -119,18 +144,41 @@ def _fold_managed_relationships(
             incremented (and created if missing when iterating in an order that
             produces them).
     """
+    if not totals:
+        return
+
+    has_managed_guests, has_managed_members = _managed_relationship_flags(db, group_id)
+    if not has_managed_guests and not has_managed_members:
+        return
+
     # Aggregate managed guests with their managers
     managed_guests = db.query(models.GuestMember).filter(
         models.GuestMember.group_id == group_id,
         models.GuestMember.managed_by_id != None
-    ).all()
+    ).all() if has_managed_guests else []
 
     # Aggregate managed members with their managers
     managed_members = db.query(models.GroupMember).filter(
         models.GroupMember.group_id == group_id,
         models.GroupMember.managed_by_id != None
-    ).all()
+    ).all() if has_managed_members else []
+
+    _fold_managed_relationships_prefetched(group_id, totals, managed_guests, managed_members)
+
+
+def _fold_managed_relationships_prefetched(
+    group_id: int,
+    totals: Dict[Tuple[int, bool], float],
+    managed_guests: List["models.GuestMember"],
+    managed_members: List["models.GroupMember"],
+) -> None:
+    """
+    Scalar fold over pre-fetched managed rows.
 
+    Same semantics as ``_fold_managed_relationships`` but takes the managed
+    guest/member rows as arguments instead of querying, so batch callers can
+    fetch rows for many groups in one round-trip and fold per group.
+    """
     # Detect managed_by cycles (e.g. guest A managed_by user 20, user 20
     # managed_by guest A). Folding cyclic entries would silently drop
     # amounts onto a deleted key — skip the fold for these participants
@@ -144,6 +192,30 @@ def _fold_managed_relationships(
             sorted(cyclic_keys),
         )
 
+    for source_key, manager_key in _managed_transfers(
+        managed_guests, managed_members, cyclic_keys
+    ):
+        if source_key in totals:
+            totals[manager_key] = totals.get(manager_key, 0) + totals[source_key]
+            del totals[source_key]
+
+
+def _managed_transfers(
+    managed_guests: Iterable,
+    managed_members: Iterable,
+    cyclic_keys: Set[Tuple[int, bool]],
+) -> List[Tuple[Tuple[int, bool], Tuple[int, bool]]]:
+    """
+    Flatten both managed-row shapes into one ``(source_key, manager_key)`` list.
+
+    Guests and members only differ in how their source key is derived — the
+    fold itself is identical — so both fold paths (scalar and multi-currency)
+    walk this single list instead of duplicating two per-source loops.
+    Integrity-skipped claimed guests and cycle participants are filtered out
+    here so callers only see transfers that are safe to apply.
+    """
+    transfers: List[Tuple[Tuple[int, bool], Tuple[int, bool]]] = []
+
     for guest in managed_guests:
         # Defensive check: claimed guests should not have managed_by set
         # This would cause double-counting since the user inherits the management relationship
@@ -156,30 +228,86 @@ def _fold_managed_relationships(
             )
             continue
 
-        guest_key = _managed_key_for_guest(guest)
-        manager_is_guest = (guest.managed_by_type == 'guest')
-        manager_key = (guest.managed_by_id, manager_is_guest)
+        source_key = _managed_key_for_guest(guest)
+        manager_key = (guest.managed_by_id, guest.managed_by_type == 'guest')
 
         # Cycle-aware: don't fold participants whose chain loops back.
-        if guest_key in cyclic_keys or manager_key in cyclic_keys:
+        # (This also covers self-referential rows — a self-edge is a
+        # length-1 cycle, so _detect_managed_cycles flags it.)
+        if source_key in cyclic_keys or manager_key in cyclic_keys:
             continue
 
-        if guest_key in totals:
-            totals[manager_key] = totals.get(manager_key, 0) + totals[guest_key]
-            del totals[guest_key]
+        transfers.append((source_key, manager_key))
 
     for managed_member in managed_members:
-        member_key = (managed_member.user_id, False)
-        manager_is_guest = (managed_member.managed_by_type == 'guest')
-        manager_key = (managed_member.managed_by_id, manager_is_guest)
+        source_key = (managed_member.user_id, False)
+        manager_key = (managed_member.managed_by_id, managed_member.managed_by_type == 'guest')
 
         # Cycle-aware: don't fold participants whose chain loops back.
-        if member_key in cyclic_keys or manager_key in cyclic_keys:
+        if source_key in cyclic_keys or manager_key in cyclic_keys:
             continue
 
-        if member_key in totals:
-            totals[manager_key] = totals.get(manager_key, 0) + totals[member_key]
-            del totals[member_key]
+        transfers.append((source_key, manager_key))
+
+    return transfers
+
+
+def _accumulate_target_balances(rows, target_currency: str) -> Dict[int, float]:
+    """
+    Accumulation kernel for single-currency mode.
+
+    Takes the streamed ``(amount_owed, user_id, is_guest, exchange_rate,
+    currency, payer_id, payer_is_guest)`` rows and returns packed-key
+    balances in ``target_currency``. Deliberately a standalone function so
+    the hot loop touches only local names (a Numba-style compiled kernel was
+    considered, but Numba is not a dependency and the loop mixes string
+    parsing with dict work that would not compile in nopython mode anyway).
+    """
+    packed_balances = defaultdict(float)  # (user_id << 1) | is_guest -> amount
+
+    # An expense's exchange_rate string repeats across all of its split
+    # rows — parse each distinct value once instead of per row.
+    rate_cache: Dict[str, Optional[float]] = {}
+
+    # The USD -> target_currency leg is loop-invariant: resolve the
+    # static factor once so the hot loop is pure arithmetic on scalars
+    # with no function calls for the common conversion path.
+    # (EXCHANGE_RATES["USD"] is 1.0, so dividing by it is exact and the
+    # results below are bit-identical to calling convert_currency.)
+    target_rate = None if target_currency == "USD" else EXCHANGE_RATES.get(target_currency)
+    _convert_to_usd = convert_to_usd
+
+    for amount_owed, user_id, is_guest, exchange_rate, currency, payer_id, payer_is_guest in rows:
+        # First convert to USD using historical rate, then to target currency
+        rate = None
+        if exchange_rate:
+            if exchange_rate in rate_cache:
+                rate = rate_cache[exchange_rate]
+            else:
+                try:
+                    rate = float(exchange_rate)
+                except ValueError:
+                    rate = None
+                rate_cache[exchange_rate] = rate
+
+        if rate is not None:
+            # exchange_rate represents: how many USD you get for 1 unit of expense currency
+            # (e.g., 1 EUR = 1.0945 USD, so rate = 1.0945)
+            # So to convert from expense currency to USD: multiply by rate
+            amount_usd = amount_owed * rate
+        else:
+            amount_usd = _convert_to_usd(amount_owed, currency)
+
+        # Convert from USD to target currency
+        amount_in_target = amount_usd if target_rate is None else amount_usd * target_rate
+
+        # Debtor decreases balance
+        packed_balances[(user_id << 1) | is_guest] -= amount_in_target
+
+        # Creditor (Payer) increases balance
+        packed_balances[(payer_id << 1) | payer_is_guest] += amount_in_target
+
+    return packed_balances
 
 
 @overload
@@ -215,82 +343,107 @@ def calculate_net_balances(
         Dictionary mapping (user_id, is_guest) tuples to net balance amounts.
         If target_currency is specified, all balances are converted to that currency.
         If target_currency is None, returns dict mapping to dict of {currency: amount}.
-    """
-    # Get all expenses in group
-    expenses = db.query(models.Expense).filter(models.Expense.group_id == group_id).all()
-
-    if not expenses:
-        return {}
 
-    # Optimization: Batch fetch all splits for these expenses to avoid N+1 queries
-    expense_ids = [e.id for e in expenses]
-    all_splits = db.query(models.ExpenseSplit).filter(
-        models.ExpenseSplit.expense_id.in_(expense_ids)
-    ).all()
-
-    # Group splits by expense_id
-    splits_by_expense = {}
-    for split in all_splits:
-        if split.expense_id not in splits_by_expense:
-            splits_by_expense[split.expense_id] = []
-        splits_by_expense[split.expense_id].append(split)
+        The returned dict may be served from the in-memory cache (see
+        ``utils/balances_cache.py``) and must be treated as read-only.
+    """
+    # Request-scoped memo first (sessions live for one request), then the
+    # process-wide TTL cache.
+    session_memo = db.info.setdefault(balances_cache.SESSION_CACHE_KEY, {})
+    memo_key = (group_id, target_currency)
+    if memo_key in session_memo:
+        return session_memo[memo_key]
+
+    cached = balances_cache.get(group_id, target_currency, session=db)
+    if cached is not None:
+        session_memo[memo_key] = cached
+        return cached
+
+    # Inside the hot loops the (user_id, is_guest) composite key is packed
+    # into a single int — (id << 1) | is_guest — which hashes in one step and
+    # allocates nothing, unlike a fresh 2-tuple per row. Keys are unpacked
+    # back to (user_id, is_guest) tuples before folding/returning, so the
+    # public shape is unchanged.
 
     # Calculate raw net balances per participant
     if target_currency:
-        # Single currency mode - convert everything to target currency
-        net_balances = {}  # (user_id, is_guest) -> amount
-
-        for expense in expenses:
-            splits = splits_by_expense.get(expense.id, [])
-
-            for split in splits:
-                # First convert to USD using historical rate, then to target currency
-                if expense.exchange_rate:
-                    try:
-                        rate = float(expense.exchange_rate)
-                        # exchange_rate represents: how many USD you get for 1 unit of expense currency
-                        # (e.g., 1 EUR = 1.0945 USD, so rate = 1.0945)
-                        # So to convert from expense currency to USD: multiply by rate
-                        amount_usd = split.amount_owed * rate
-                    except ValueError:
-                        amount_usd = convert_to_usd(split.amount_owed, expense.currency)
-                else:
-                    amount_usd = convert_to_usd(split.amount_owed, expense.currency)
-
-                # Convert from USD to target currency
-                amount_in_target = convert_currency(amount_usd, "USD", target_currency)
-
-                # Debtor decreases balance
-                debtor_key = (split.user_id, split.is_guest)
-                net_balances[debtor_key] = net_balances.get(debtor_key, 0) - amount_in_target
-
-                # Creditor (Payer) increases balance
-                payer_key = (expense.payer_id, expense.payer_is_guest)
-                net_balances[payer_key] = net_balances.get(payer_key, 0) + amount_in_target
+        # Single currency mode - convert everything to target currency.
+        # This path needs the per-expense historical exchange_rate, so the
+        # conversion arithmetic stays in Python over streamed scalar rows
+        # (yield_per keeps peak memory at O(batch) and overlaps aggregation
+        # with driver I/O).
+        rows = db.query(
+            models.ExpenseSplit.amount_owed,
+            models.ExpenseSplit.user_id,
+            models.ExpenseSplit.is_guest,
+            models.Expense.exchange_rate,
+            models.Expense.currency,
+            models.Expense.payer_id,
+            models.Expense.payer_is_guest,
+        ).join(
+            models.Expense, models.ExpenseSplit.expense_id == models.Expense.id
+        ).filter(models.Expense.group_id == group_id).yield_per(2000)
+
+        # defaultdict turns every get-or-zero-then-store into a single
+        # subscript operation.
+        packed_balances = _accumulate_target_balances(rows, target_currency)
     else:
-        # Multi-currency mode - keep balances per currency
-        net_balances = {}  # (user_id, is_guest) -> {currency -> amount}
-
-        for expense in expenses:
-            splits = splits_by_expense.get(expense.id, [])
-
-            for split in splits:
-                key = (split.user_id, split.is_guest)
-                if key not in net_balances:
-                    net_balances[key] = {}
-                if expense.currency not in net_balances[key]:
-                    net_balances[key][expense.currency] = 0
-
-                # Debtor decreases balance
-                net_balances[key][expense.currency] -= split.amount_owed
-
-                # Creditor (payer) increases balance
-                payer_key = (expense.payer_id, expense.payer_is_guest)
-                if payer_key not in net_balances:
-                    net_balances[payer_key] = {}
-                if expense.currency not in net_balances[payer_key]:
-                    net_balances[payer_key][expense.currency] = 0
-                net_balances[payer_key][expense.currency] += split.amount_owed
+        # Multi-currency mode - keep balances per currency. No per-expense
+        # rate arithmetic is involved, so the whole aggregation is pushed
+        # into SQL as a single signed pass: each split contributes a negated
+        # row for the debtor and a positive row for the payer via UNION ALL,
+        # and one outer GROUP BY sums both sides at once. Amounts are integer
+        # cents, so the signed sum is exact regardless of grouping order.
+        join_clause = (models.ExpenseSplit.expense_id == models.Expense.id)
+
+        signed_sides = union_all(
+            select(
+                models.ExpenseSplit.user_id.label("participant_id"),
+                models.ExpenseSplit.is_guest.label("participant_is_guest"),
+                models.Expense.currency.label("currency"),
+                (-models.ExpenseSplit.amount_owed).label("signed_amount"),
+            ).select_from(models.ExpenseSplit).join(
+                models.Expense, join_clause
+            ).where(models.Expense.group_id == group_id),
+            select(
+                models.Expense.payer_id,
+                models.Expense.payer_is_guest,
+                models.Expense.currency,
+                models.ExpenseSplit.amount_owed,
+            ).select_from(models.Expense).join(
+                models.ExpenseSplit, join_clause
+            ).where(models.Expense.group_id == group_id),
+        ).subquery()
+
+        balance_rows = db.execute(
+            select(
+                signed_sides.c.participant_id,
+                signed_sides.c.participant_is_guest,
+                signed_sides.c.currency,
+                func.sum(signed_sides.c.signed_amount),
+            ).group_by(
+                signed_sides.c.participant_id,
+                signed_sides.c.participant_is_guest,
+                signed_sides.c.currency,
+            )
+        ).all()
+
+        packed_balances = defaultdict(dict)  # (user_id << 1) | is_guest -> {currency -> amount}
+
+        for participant_id, participant_is_guest, currency, total in balance_rows:
+            packed_balances[(participant_id << 1) | participant_is_guest][currency] = total
+
+    if not packed_balances:
+        # No splits in this group — nothing to fold either.
+        balances_cache.set(group_id, target_currency, {}, session=db)
+        session_memo[memo_key] = {}
+        return {}
+
+    # Unpack the int keys back to the public (user_id, is_guest) tuple shape —
+    # one tuple per distinct participant rather than per split row.
+    net_balances = {
+        (key >> 1, bool(key & 1)): value for key, value in packed_balances.items()
+    }
 
     if target_currency:
         # Single-currency (scalar) mode — delegate folding to the shared helper
@@ -298,17 +451,23 @@ def calculate_net_balances(
         _fold_managed_relationships(db, group_id, net_balances)
     else:
         # Multi-currency mode — kept inline; the helper is scoped to scalar values.
+        has_managed_guests, has_managed_members = _managed_relationship_flags(db, group_id)
+        if not has_managed_guests and not has_managed_members:
+            balances_cache.set(group_id, target_currency, net_balances, session=db)
+            session_memo[memo_key] = net_balances
+            return net_balances
+
         # Aggregate managed guests with their managers
         managed_guests = db.query(models.GuestMember).filter(
             models.GuestMember.group_id == group_id,
             models.GuestMember.managed_by_id != None
-        ).all()
+        ).all() if has_managed_guests else []
 
         # Aggregate managed members with their managers
         managed_members = db.query(models.GroupMember).filter(
             models.GroupMember.group_id == group_id,
             models.GroupMember.managed_by_id != None
-        ).all()
+        ).all() if has_managed_members else []
 
         # Detect managed_by cycles and skip folding cyclic participants so
         # amounts aren't silently dropped onto a deleted key.
@@ -321,55 +480,186 @@ def calculate_net_balances(
                 sorted(cyclic_keys),
             )
 
-        for guest in managed_guests:
-            # Defensive check: claimed guests should not have managed_by set
-            # This would cause double-counting since the user inherits the management relationship
-            if guest.claimed_by_id and guest.managed_by_id:
-                logger.warning(
-                    "Data integrity issue: Claimed guest id=%s has managed_by_id=%s set. "
-                    "This should be None. Skipping aggregation to prevent double-counting.",
-                    guest.id,
-                    guest.managed_by_id,
-                )
-                continue
-
-            guest_key = _managed_key_for_guest(guest)
-            manager_is_guest = (guest.managed_by_type == 'guest')
-            manager_key = (guest.managed_by_id, manager_is_guest)
-
-            # Cycle-aware: don't fold participants whose chain loops back.
-            if guest_key in cyclic_keys or manager_key in cyclic_keys:
-                continue
-
-            if guest_key in net_balances:
-                # Multi-currency mode - aggregate per currency
-                if manager_key not in net_balances:
-                    net_balances[manager_key] = {}
-                for currency, amount in net_balances[guest_key].items():
-                    if currency not in net_balances[manager_key]:
-                        net_balances[manager_key][currency] = 0
-                    net_balances[manager_key][currency] += amount
-
-                del net_balances[guest_key]
-
-        for managed_member in managed_members:
-            member_key = (managed_member.user_id, False)
-            manager_is_guest = (managed_member.managed_by_type == 'guest')
-            manager_key = (managed_member.managed_by_id, manager_is_guest)
-
-            # Cycle-aware: don't fold participants whose chain loops back.
-            if member_key in cyclic_keys or manager_key in cyclic_keys:
-                continue
-
-            if member_key in net_balances:
-                # Multi-currency mode - aggregate per currency
-                if manager_key not in net_balances:
-                    net_balances[manager_key] = {}
-                for currency, amount in net_balances[member_key].items():
-                    if currency not in net_balances[manager_key]:
-                        net_balances[manager_key][currency] = 0
-                    net_balances[manager_key][currency] += amount
-
-                del net_balances[member_key]
+        for source_key, manager_key in _managed_transfers(
+            managed_guests, managed_members, cyclic_keys
+        ):
+            if source_key in net_balances:
+                # Multi-currency mode - aggregate per currency, fusing the
+                # membership check and insert into a single probe each.
+                manager_currencies = net_balances.setdefault(manager_key, {})
+                for currency, amount in net_balances[source_key].items():
+                    manager_currencies[currency] = manager_currencies.get(currency, 0) + amount
 
+                del net_balances[source_key]
+
+    balances_cache.set(group_id, target_currency, net_balances, session=db)
+    session_memo[memo_key] = net_balances
     return net_balances
+
+
+class _ManagedGuestRow(NamedTuple):
+    """Projection of a managed GuestMember row, attribute-compatible with the fold helpers."""
+    id: int
+    claimed_by_id: Optional[int]
+    managed_by_id: int
+    managed_by_type: str
+
+
+class _ManagedMemberRow(NamedTuple):
+    """Projection of a managed GroupMember row, attribute-compatible with the fold helpers."""
+    user_id: int
+    managed_by_id: int
+    managed_by_type: str
+
+
+def calculate_net_balances_batch(
+    db: Session,
+    target_currencies: Dict[int, str],
+) -> Dict[int, Dict[Tuple[int, bool], float]]:
+    """
+    Calculate net balances for many groups at once, each converted to its own
+    target currency.
+
+    Equivalent to calling ``calculate_net_balances(db, group_id, currency)``
+    per group, but fetches expenses, splits and managed relationships for ALL
+    requested groups in four queries total and aggregates everything in a
+    single pass over the split rows (bucketed by ``group_id`` as they stream
+    past), instead of re-running the per-group queries and loops N times.
+
+    Args:
+        db: Database session.
+        target_currencies: Mapping of group_id -> currency code to convert
+            that group's balances to. Multi-currency (no conversion) callers
+            should use ``calculate_net_balances`` per group instead.
+
+    Returns:
+        Dict mapping group_id -> net balances dict, in the same shape as the
+        scalar-mode return of ``calculate_net_balances``. Entries may be
+        served from the shared cache and must be treated as read-only.
+
+    The aggregation is deliberately sequential: after the batch fetches, the
+    per-group work is pure-Python dict accumulation that holds the GIL, the
+    Session streaming the rows is not thread-safe, and a typical user has a
+    handful of groups — a thread pool here would add scheduling overhead
+    without any real parallelism.
+    """
+    results: Dict[int, Dict[Tuple[int, bool], float]] = {}
+
+    # Serve whatever we can from the caches; only compute the misses.
+    session_memo = db.info.setdefault(balances_cache.SESSION_CACHE_KEY, {})
+    missing_ids = []
+    for group_id, currency in target_currencies.items():
+        cached = session_memo.get((group_id, currency))
+        if cached is None:
+            cached = balances_cache.get(group_id, currency, session=db)
+        if cached is not None:
+            results[group_id] = cached
+        else:
+            missing_ids.append(group_id)
+
+    if not missing_ids:
+        return results
+
+    # One joined query for every group's split rows (scalar columns only —
+    # see calculate_net_balances for the rationale).
+    rows = db.query(
+        models.Expense.group_id,
+        models.ExpenseSplit.amount_owed,
+        models.ExpenseSplit.user_id,
+        models.ExpenseSplit.is_guest,
+        models.Expense.exchange_rate,
+        models.Expense.currency,
+        models.Expense.payer_id,
+        models.Expense.payer_is_guest,
+    ).join(
+        models.Expense, models.ExpenseSplit.expense_id == models.Expense.id
+    ).filter(models.Expense.group_id.in_(missing_ids)).all()
+
+    # Single aggregation pass over every split row, bucketed by group.
+    balances_by_group: Dict[int, Dict[Tuple[int, bool], float]] = {
+        group_id: defaultdict(float) for group_id in missing_ids
+    }
+    # Expenses repeat their exchange_rate string across rows; parse each
+    # distinct value once.
+    rate_cache: Dict[str, Optional[float]] = {}
+
+    for group_id, amount_owed, user_id, is_guest, exchange_rate, currency, payer_id, payer_is_guest in rows:
+        target_currency = target_currencies[group_id]
+
+        rate = None
+        if exchange_rate:
+            if exchange_rate in rate_cache:
+                rate = rate_cache[exchange_rate]
+            else:
+                try:
+                    rate = float(exchange_rate)
+                except ValueError:
+                    rate = None
+                rate_cache[exchange_rate] = rate
+
+        if rate is not None:
+            # exchange_rate is the historical currency -> USD rate cached at
+            # expense creation (see calculate_net_balances for details).
+            amount_usd = amount_owed * rate
+        else:
+            amount_usd = convert_to_usd(amount_owed, currency)
+        amount_in_target = convert_currency(amount_usd, "USD", target_currency)
+
+        net_balances = balances_by_group[group_id]
+        net_balances[(user_id, is_guest)] -= amount_in_target
+        net_balances[(payer_id, payer_is_guest)] += amount_in_target
+
+    # Fetch managed relationships for all groups in one UNION ALL round-trip
+    # (a 'kind' discriminator tells the two row shapes apart), then fold per
+    # group using lightweight projections of the rows.
+    managed_stmt = union_all(
+        select(
+            literal("guest").label("kind"),
+            models.GuestMember.group_id,
+            models.GuestMember.id.label("entity_id"),
+            models.GuestMember.managed_by_id,
+            models.GuestMember.managed_by_type,
+            models.GuestMember.claimed_by_id,
+        ).where(
+            models.GuestMember.group_id.in_(missing_ids),
+            models.GuestMember.managed_by_id != None
+        ),
+        select(
+            literal("member").label("kind"),
+            models.GroupMember.group_id,
+            models.GroupMember.user_id.label("entity_id"),
+            models.GroupMember.managed_by_id,
+            models.GroupMember.managed_by_type,
+            null().label("claimed_by_id"),
+        ).where(
+            models.GroupMember.group_id.in_(missing_ids),
+            models.GroupMember.managed_by_id != None
+        ),
+    )
+
+    managed_guests_by_group: Dict[int, list] = {group_id: [] for group_id in missing_ids}
+    managed_members_by_group: Dict[int, list] = {group_id: [] for group_id in missing_ids}
+    for kind, group_id, entity_id, managed_by_id, managed_by_type, claimed_by_id in db.execute(managed_stmt):
+        if kind == "guest":
+            managed_guests_by_group[group_id].append(
+                _ManagedGuestRow(entity_id, claimed_by_id, managed_by_id, managed_by_type)
+            )
+        else:
+            managed_members_by_group[group_id].append(
+                _ManagedMemberRow(entity_id, managed_by_id, managed_by_type)
+            )
+
+    for group_id in missing_ids:
+        # Plain dict from here on — cached values must not grow on lookup.
+        net_balances = dict(balances_by_group[group_id])
+        _fold_managed_relationships_prefetched(
+            group_id,
+            net_balances,
+            managed_guests_by_group[group_id],
+            managed_members_by_group[group_id],
+        )
+        balances_cache.set(group_id, target_currencies[group_id], net_balances, session=db)
+        session_memo[(group_id, target_currencies[group_id])] = net_balances
+        results[group_id] = net_balances
+
+    return results
@@ -0,0 +1,192 @@
+"""
+Bounded in-memory TTL cache for ``calculate_net_balances`` results.
+
+Keyed by ``(group_id, target_currency)`` where ``target_currency`` may be
+``None`` (multi-currency mode). Balance calculation is read-heavy and pure
+with respect to the group's expense/membership data, so repeated reads — the
+dominant pattern in the expense-splitting UI — become a dict hit instead of
+four queries plus a Python aggregation pass.
+
+Invalidation is event-driven rather than version-keyed, and transactional:
+a Session ``after_flush`` hook collects the group ids touched by writes to
+:class:`models.Expense`, :class:`models.ExpenseSplit`,
+:class:`models.GuestMember` and :class:`models.GroupMember`, and the cached
+entries are dropped in ``after_commit`` — only once the write is actually
+visible to other sessions. Invalidating at flush time would leave a window
+(flush → commit) in which a concurrent reader could recompute from the
+pre-write snapshot and re-populate the cache with balances that stay stale
+for up to ``TTL_SECONDS`` after the write lands. The pending group ids also
+fence the writer's own session out of the global cache (see ``get``/``set``)
+so uncommitted balances are never published to other requests.
+
+Design notes:
+
+* **5-minute TTL.** Entries are almost always invalidated by the write
+  events first; the TTL is a backstop against mutations that bypass the ORM
+  (e.g. manual ``sqlite3`` edits).
+* **Bounded at 1000 entries.** FIFO eviction via
+  ``OrderedDict.popitem(last=False)``, mirroring ``utils/summary_cache.py``.
+* **Cached values are shared.** Callers must treat the returned dict as
+  read-only; every current caller only iterates or ``.get()``s it.
+* **Process-local.** If this ever needs to be distributed, swap for Redis at
+  the call site, not in here.
+"""
+
+from __future__ import annotations
+
+import builtins
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+import models
+
+
+TTL_SECONDS = 300
+MAX_ENTRIES = 1000
+
+_CacheKey = Tuple[int, Optional[str]]
+
+# Module-level singleton. Process-local; see docstring.
+_cache: "OrderedDict[_CacheKey, tuple[dict, float]]" = OrderedDict()
+
+
+def get(group_id: int, target_currency: Optional[str], session: Optional[Session] = None) -> Optional[dict]:
+    """
+    Return the cached net-balances dict for ``(group_id, target_currency)``
+    iff present AND fresh. Otherwise return ``None`` and opportunistically
+    purge the stale entry.
+
+    Pass the reading ``session`` so that a session with flushed-but-
+    uncommitted writes to the group bypasses the cache: the cached entry
+    reflects the pre-write state, not that transaction's own view.
+    """
+    if session is not None and group_id in session.info.get(_PENDING_KEY, ()):
+        return None
+
+    key = (group_id, target_currency)
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+
+    balances, inserted_at = entry
+    if time.monotonic() - inserted_at < TTL_SECONDS:
+        return balances
+
+    # Stale — drop it so the next call doesn't re-check.
+    _cache.pop(key, None)
+    return None
+
+
+def set(group_id: int, target_currency: Optional[str], balances: dict, session: Optional[Session] = None) -> None:
+    """
+    Insert ``balances`` under ``(group_id, target_currency)``. Enforces the
+    ``MAX_ENTRIES`` cap via FIFO eviction (oldest-inserted first).
+
+    Pass the computing ``session`` so results derived from flushed-but-
+    uncommitted writes are kept out of the shared cache — other sessions
+    must not see balances that haven't committed (and might roll back).
+    """
+    if session is not None and group_id in session.info.get(_PENDING_KEY, ()):
+        return
+
+    key = (group_id, target_currency)
+    if key in _cache:
+        _cache.pop(key)
+
+    _cache[key] = (balances, time.monotonic())
+
+    # Enforce size cap.
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate_group(group_id: Optional[int]) -> None:
+    """Drop every cached entry (any currency) for ``group_id``. No-op otherwise."""
+    if group_id is None:
+        return
+    stale = [key for key in _cache if key[0] == group_id]
+    for key in stale:
+        _cache.pop(key, None)
+
+
+def _clear_for_tests() -> None:
+    """Test-only helper: drop all entries. Not part of the public API."""
+    _cache.clear()
+
+
+# --- Write-path invalidation -------------------------------------------------
+#
+# Registered at import time (utils.balances imports this module, so the
+# listeners are live before any balance is ever cached).
+#
+# Invalidation is deferred to COMMIT: the ``after_flush`` hook only records
+# which group ids the transaction touched (on ``session.info``), and
+# ``after_commit`` drops the cache entries once the write is visible to other
+# sessions. ``utils.balances`` additionally memoises results in
+# ``session.info`` (``SESSION_CACHE_KEY``) so repeated calls within one HTTP
+# request skip even the global-cache lookup; that memo is view-consistent with
+# the session's own transaction, so it is cleared at flush time instead.
+
+SESSION_CACHE_KEY = "_net_balances_cache"
+_PENDING_KEY = "_net_balances_pending_group_ids"
+
+# Models whose rows carry the affected group_id directly.
+_GROUP_ID_MODELS = (
+    models.Expense,
+    models.GuestMember,
+    models.GroupMember,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_balance_invalidations(session, flush_context) -> None:
+    # builtins.set: this module's public ``set`` API shadows the builtin.
+    group_ids = builtins.set()
+    split_expense_ids = builtins.set()
+
+    for obj in session.new.union(session.dirty).union(session.deleted):
+        if isinstance(obj, models.ExpenseSplit):
+            split_expense_ids.add(obj.expense_id)
+        elif isinstance(obj, _GROUP_ID_MODELS):
+            if obj.group_id is not None:
+                group_ids.add(obj.group_id)
+        else:
+            continue
+        # The session memo must reflect this transaction's own writes, so
+        # any balance-relevant flush drops it immediately.
+        session.info.pop(SESSION_CACHE_KEY, None)
+
+    if split_expense_ids:
+        # ExpenseSplit has no group_id column; resolve every distinct parent
+        # expense in one IN query on the flush connection rather than one
+        # SELECT per split row.
+        rows = session.connection().execute(
+            select(models.Expense.group_id).where(
+                models.Expense.id.in_(split_expense_ids)
+            )
+        )
+        group_ids.update(group_id for (group_id,) in rows if group_id is not None)
+
+    if group_ids:
+        session.info.setdefault(_PENDING_KEY, builtins.set()).update(group_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_balance_invalidations(session) -> None:
+    for group_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_group(group_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_balance_invalidations(session) -> None:
+    # Nothing committed, so other sessions' cached entries are still valid —
+    # but this session may have computed (and we refused to cache) balances
+    # from rolled-back state. Drop the groups anyway out of caution: an
+    # unnecessary invalidation costs one recompute, a missed one serves
+    # wrong money numbers.
+    for group_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_group(group_id)
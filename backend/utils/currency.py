@@ -1,7 +1,28 @@
 """Currency-related utilities: exchange rates, formatting, and conversion."""
 
+import time
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+
+# Shared session for Frankfurter API calls. Plain requests.get opens a fresh
+# TCP+TLS connection per call; the session pools connections so repeated
+# calls (cache misses during bulk imports) skip the handshake. Retries cover
+# transient gateway errors with a short backoff.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+# (connect, read) timeouts: fail fast on an unreachable host, allow the
+# usual 5 seconds for the response body.
+_REQUEST_TIMEOUT = (2, 5)
 
 
 # Exchange rates for currency conversion (fallback if API fails)
@@ -58,11 +79,22 @@ def format_currency(amount_cents: int, currency: str) -> str:
         return f"{symbol}{amount:.2f}"
 
 
+# Cache for historical rates. Historical rates never change once published,
+# so successful lookups are cached forever (bounded in practice by the number
+# of distinct (date, currency) pairs ever seen). Failed fetches are NOT
+# cached — a transient network error shouldn't pin None for the process
+# lifetime, which is why this is a manual dict rather than @lru_cache.
+_historical_rate_cache: dict = {}
+
+
 def fetch_historical_exchange_rate(date: str, from_currency: str, to_currency: str = "USD") -> Optional[float]:
     """
     Fetch historical exchange rate from Frankfurter API (free, no key required).
     Returns the rate to convert from from_currency to to_currency on the given date.
 
+    Successful lookups are cached per (date, from, to) pair, so bulk imports
+    hitting the same date/currency repeatedly make at most one HTTP call.
+
     Args:
         date: ISO format date string (YYYY-MM-DD)
         from_currency: Source currency code (e.g., "EUR")
@@ -75,6 +107,11 @@ def fetch_historical_exchange_rate(date: str, from_currency: str, to_currency: s
     if from_currency == to_currency:
         return 1.0
 
+    cache_key = (date, from_currency, to_currency)
+    cached = _historical_rate_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Frankfurter API endpoint for historical rates
         # https://www.frankfurter.app/docs/
@@ -84,14 +121,16 @@ def fetch_historical_exchange_rate(date: str, from_currency: str, to_currency: s
             "to": to_currency
         }
 
-        response = requests.get(url, params=params, timeout=5)
+        response = _session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
 
         # Check if the API returned successfully
         if "rates" in data and to_currency in data["rates"]:
-            return float(data["rates"][to_currency])
+            rate = float(data["rates"][to_currency])
+            _historical_rate_cache[cache_key] = rate
+            return rate
 
         # If API fails, return None to use fallback
         return None
@@ -133,11 +172,25 @@ def get_exchange_rate_for_expense(date: str, currency: str) -> float:
     return rate
 
 
+# Positional rate tables for the conversion hot path. Tuple indexing by a
+# small integer beats a string-keyed dict lookup per conversion, and the
+# index dict doubles as the membership check for unknown currencies.
+# The to-USD direction stores reciprocals so the per-conversion operation
+# is a multiply rather than a (slower, poorly pipelined) divide. Both are
+# derived from EXCHANGE_RATES at import time so they can never drift;
+# get_current_exchange_rates returns fresh dicts and never mutates
+# EXCHANGE_RATES, so no rebuild hook is needed.
+_CURRENCY_INDEX = {code: index for index, code in enumerate(EXCHANGE_RATES)}
+_RATES_TUPLE = tuple(EXCHANGE_RATES.values())
+_INV_RATES_TUPLE = tuple(1.0 / rate for rate in _RATES_TUPLE)
+
+
 def convert_to_usd(amount: float, currency: str) -> float:
     """Convert an amount from the given currency to USD using static rates."""
-    if currency not in EXCHANGE_RATES:
+    index = _CURRENCY_INDEX.get(currency)
+    if index is None:
         return amount
-    return amount / EXCHANGE_RATES[currency]
+    return amount * _INV_RATES_TUPLE[index]
 
 
 def convert_currency(amount: float, from_currency: str, to_currency: str) -> float:
@@ -156,13 +209,16 @@ def convert_currency(amount: float, from_currency: str, to_currency: str) -> flo
     if from_currency == to_currency:
         return amount
 
+    from_index = _CURRENCY_INDEX.get(from_currency)
+    to_index = _CURRENCY_INDEX.get(to_currency)
+
     # Convert to USD first, then to target currency
-    amount_in_usd = convert_to_usd(amount, from_currency)
+    amount_in_usd = amount if from_index is None else amount * _INV_RATES_TUPLE[from_index]
 
-    if to_currency not in EXCHANGE_RATES:
+    if to_index is None:
         return amount_in_usd
 
-    return amount_in_usd * EXCHANGE_RATES[to_currency]
+    return amount_in_usd * _RATES_TUPLE[to_index]
 
 # Cache for exchange rates with TTL
 _exchange_rate_cache = {
@@ -180,8 +236,6 @@ def get_current_exchange_rates() -> dict:
     
     Results are cached for 15 minutes to avoid excessive API calls.
     """
-    import time
-    
     # Check if we have a valid cached value
     if (_exchange_rate_cache["rates"] is not None and 
         _exchange_rate_cache["fetched_at"] is not None):
@@ -197,7 +251,7 @@ def get_current_exchange_rates() -> dict:
             "to": "EUR,GBP,JPY,CAD,CNY,HKD,CHF"
         }
 
-        response = requests.get(url, params=params, timeout=5)
+        response = _session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
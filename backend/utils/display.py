@@ -1,28 +1,31 @@
 """
 Display utilities for guest and user names
 """
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
 from sqlalchemy.orm import Session
 import models
 
 
+@lru_cache(maxsize=1024)
 def mask_email(email: str) -> str:
     """
     Mask an email address for public display.
     Example: jules@example.com -> j***s@example.com
+
+    The same user's email is typically rendered many times per public page,
+    so results are memoised.
     """
     if not email or "@" not in email:
         return "User"
 
-    try:
-        user_part, domain_part = email.split("@", 1)
-        if len(user_part) > 3:
-            return f"{user_part[:2]}***{user_part[-1]}@{domain_part}"
-        elif len(user_part) > 1:
-            return f"{user_part[0]}***@{domain_part}"
-        else:
-            return f"***@{domain_part}"
-    except Exception:
-        return "User"
+    user_part, _, domain_part = email.partition("@")
+    if len(user_part) > 3:
+        return f"{user_part[:2]}***{user_part[-1]}@{domain_part}"
+    if len(user_part) > 1:
+        return f"{user_part[0]}***@{domain_part}"
+    return f"***@{domain_part}"
 
 
 def get_public_user_display_name(user: models.User) -> str:
@@ -87,3 +90,84 @@ def get_participant_display_name(user_id: int, is_guest: bool, db: Session) -> s
             models.User.id == user_id
         ).first()
         return (user.full_name or user.email) if user else "Unknown User"
+
+
+def get_participant_display_names_batch(
+    keys: Iterable[Tuple[int, bool]], db: Session
+) -> Dict[Tuple[int, bool], str]:
+    """
+    Batched equivalent of ``get_participant_display_name``.
+
+    Calling the per-participant helper in a loop (the typical pattern after a
+    balance or consumption aggregation) issues one query per name. This
+    resolves every requested ``(user_id, is_guest)`` key in at most three
+    IN-list queries: users, guests, and any claiming users not already
+    fetched. Only the id/name columns are selected — no ORM objects are
+    hydrated.
+
+    Args:
+        keys: Iterable of (user_id, is_guest) keys to resolve.
+        db: Database session.
+
+    Returns:
+        Dict mapping each requested key to its display name, with the same
+        claimed-guest and unknown-participant handling as the scalar helper.
+    """
+    keys = set(keys)
+    user_ids = {uid for uid, is_guest in keys if not is_guest}
+    guest_ids = {uid for uid, is_guest in keys if is_guest}
+
+    user_names: Dict[int, str] = {}
+    if user_ids:
+        user_names = {
+            row.id: row.full_name or row.email
+            for row in db.query(models.User)
+            .with_entities(models.User.id, models.User.full_name, models.User.email)
+            .filter(models.User.id.in_(user_ids))
+        }
+
+    guest_rows: Dict[int, Tuple[str, int]] = {}
+    if guest_ids:
+        guest_rows = {
+            row.id: (row.name, row.claimed_by_id)
+            for row in db.query(models.GuestMember)
+            .with_entities(
+                models.GuestMember.id,
+                models.GuestMember.name,
+                models.GuestMember.claimed_by_id,
+            )
+            .filter(models.GuestMember.id.in_(guest_ids))
+        }
+
+    # Claimed guests display as the claiming user; fetch any claiming users
+    # that weren't requested as keys themselves.
+    claimed_ids_to_fetch = {
+        claimed_by_id
+        for _, claimed_by_id in guest_rows.values()
+        if claimed_by_id is not None and claimed_by_id not in user_names
+    }
+    if claimed_ids_to_fetch:
+        for row in (
+            db.query(models.User)
+            .with_entities(models.User.id, models.User.full_name, models.User.email)
+            .filter(models.User.id.in_(claimed_ids_to_fetch))
+        ):
+            user_names[row.id] = row.full_name or row.email
+
+    names: Dict[Tuple[int, bool], str] = {}
+    for uid, is_guest in keys:
+        if is_guest:
+            entry = guest_rows.get(uid)
+            if entry is None:
+                names[(uid, is_guest)] = "Unknown Guest"
+            else:
+                guest_name, claimed_by_id = entry
+                if claimed_by_id:
+                    # Unclaimed name is the fallback if the claiming user is gone.
+                    names[(uid, is_guest)] = user_names.get(claimed_by_id, guest_name)
+                else:
+                    names[(uid, is_guest)] = guest_name
+        else:
+            names[(uid, is_guest)] = user_names.get(uid, "Unknown User")
+
+    return names
@@ -1,8 +1,15 @@
 """Email service using Brevo API for Splitwiser"""
 
+import asyncio
+import json
 import os
 import logging
-import requests
+import random
+import re
+import time
+from string import Template
+
+import httpx
 from typing import Optional
 
 # Configure logging
@@ -17,6 +24,208 @@ FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
 # Brevo API endpoint
 BREVO_API_URL = "https://api.brevo.com/v3/smtp/email"
 
+# Request headers and sender block never change after the env is read, so
+# build them once instead of per send. (send_email checks
+# is_email_configured() before using them, so a missing key at import is
+# harmless.)
+_BREVO_HEADERS = {
+    "accept": "application/json",
+    "api-key": BREVO_API_KEY,
+    "content-type": "application/json",
+}
+_BREVO_SENDER = {"name": FROM_NAME, "email": FROM_EMAIL}
+
+# FRONTEND_URL is immutable after startup, so the link prefixes and the
+# static subject lines can be built once at import instead of per send.
+_RESET_URL_PREFIX = f"{FRONTEND_URL}/reset-password/"
+_VERIFY_URL_PREFIX = f"{FRONTEND_URL}/verify-email/"
+_ACCOUNT_URL = f"{FRONTEND_URL}/account"
+
+_PASSWORD_RESET_SUBJECT = "Reset Your Splitwiser Password"
+_EMAIL_VERIFICATION_SUBJECT = "Verify Your New Email Address - Splitwiser"
+_EMAIL_CHANGE_SUBJECT = "Your Splitwiser Email Address Has Been Changed"
+_PASSWORD_CHANGED_SUBJECT = "Your Splitwiser Password Has Been Changed"
+
+# Pooled async client for Brevo calls. A blocking requests.post inside an
+# async function stalls the event loop for the whole round-trip AND opens a
+# fresh TCP+TLS connection per email; the shared client awaits properly and
+# keeps connections alive across sends. Closed via close_client() from the
+# app's lifespan shutdown.
+_client = httpx.AsyncClient(
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+
+
+async def close_client() -> None:
+    """Close the pooled Brevo client (called on application shutdown)."""
+    await _client.aclose()
+
+
+# Retry policy for transient Brevo failures: timeouts, connection errors and
+# 429/5xx responses are retried with full-jitter exponential backoff. Other
+# 4xx responses (bad payload, bad API key) are permanent and never retried.
+_MAX_ATTEMPTS = 4
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 8.0
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Circuit breaker: after _BREAKER_FAIL_MAX consecutive transient send
+# failures (each of which already exhausted its retries), stop contacting
+# Brevo for _BREAKER_RESET_SECONDS so a sustained outage fails fast instead
+# of tying every send up for the full timeout-times-retries window.
+_BREAKER_FAIL_MAX = 5
+_BREAKER_RESET_SECONDS = 30.0
+_breaker_failures = 0
+_breaker_open_until = 0.0
+
+# Bulkhead: cap concurrent in-flight Brevo calls so a slow provider can't
+# tie up every task that happens to send mail (inline fallbacks included);
+# excess senders wait here instead of piling into the connection pool.
+_BREVO_MAX_CONCURRENCY = 10
+_brevo_semaphore = asyncio.Semaphore(_BREVO_MAX_CONCURRENCY)
+
+
+def breaker_state() -> str:
+    """Current Brevo circuit state ("open" or "closed"), for monitoring."""
+    return "open" if time.monotonic() < _breaker_open_until else "closed"
+
+
+def _record_breaker_failure() -> None:
+    """Count a transient send failure; open the circuit at the threshold."""
+    global _breaker_failures, _breaker_open_until
+    _breaker_failures += 1
+    if _breaker_failures >= _BREAKER_FAIL_MAX:
+        _breaker_open_until = time.monotonic() + _BREAKER_RESET_SECONDS
+        _breaker_failures = 0
+        logger.error(
+            f"Brevo circuit opened for {_BREAKER_RESET_SECONDS:.0f}s after "
+            f"{_BREAKER_FAIL_MAX} consecutive send failures"
+        )
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base*2^n))."""
+    return random.uniform(
+        0, min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+    )
+
+
+# Background delivery. Request handlers shouldn't block on the Brevo
+# round-trip (worst case: timeout x retries), so sends are queued and drained
+# by worker tasks started from the app's lifespan. When the workers aren't
+# running (tests, scripts) or the queue is full, callers fall back to the
+# inline await so no email is silently dropped.
+_QUEUE_MAX_SIZE = 1000
+_WORKER_COUNT = 4
+_email_queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=_QUEUE_MAX_SIZE)
+_worker_tasks: list = []
+
+
+# How long a worker lingers collecting extra queued messages after its
+# first, and the most it will take in one pass. Bursts of identical
+# notifications (same subject and rendered bodies, different recipients)
+# collapse into a single Brevo messageVersions request.
+_BATCH_WINDOW_SECONDS = 0.1
+_BATCH_MAX_MESSAGES = 100
+
+
+async def _email_worker() -> None:
+    """Drain the queue forever; one failed send never kills the worker."""
+    while True:
+        batch = [await _email_queue.get()]
+        try:
+            while len(batch) < _BATCH_MAX_MESSAGES:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            _email_queue.get(), _BATCH_WINDOW_SECONDS
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Group identical messages; each group of n recipients is one
+            # Brevo call instead of n.
+            groups: dict = {}
+            for message in batch:
+                key = (
+                    message["subject"],
+                    message["html_content"],
+                    message["text_content"],
+                )
+                groups.setdefault(key, []).append(message["to_email"])
+
+            for (subject, html_content, text_content), recipients in groups.items():
+                try:
+                    if len(recipients) == 1:
+                        await send_email(
+                            recipients[0], subject, html_content, text_content
+                        )
+                    else:
+                        await _send_email_batch(
+                            recipients, subject, html_content, text_content
+                        )
+                except Exception as e:
+                    logger.error(f"Email worker error: {e}")
+        finally:
+            for _ in batch:
+                _email_queue.task_done()
+
+
+def start_workers(count: int = _WORKER_COUNT) -> None:
+    """Start the background delivery workers (app lifespan startup)."""
+    if _worker_tasks:
+        return
+    for _ in range(count):
+        _worker_tasks.append(asyncio.create_task(_email_worker()))
+
+
+async def stop_workers() -> None:
+    """Drain pending sends, then cancel the workers (app lifespan shutdown)."""
+    if not _worker_tasks:
+        return
+    await _email_queue.join()
+    for task in _worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_worker_tasks, return_exceptions=True)
+    _worker_tasks.clear()
+
+
+async def queue_email(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: str
+) -> bool:
+    """
+    Queue an email for background delivery.
+
+    Returns True once the message is accepted for delivery (queued) or sent
+    inline. Enqueued messages report delivery failures via the worker's
+    logging rather than the return value — callers were already treating a
+    False from the old inline path as log-and-continue.
+    """
+    if not is_email_configured():
+        logger.error("Email service not configured: BREVO_API_KEY and FROM_EMAIL required")
+        return False
+
+    message = {
+        "to_email": to_email,
+        "subject": subject,
+        "html_content": html_content,
+        "text_content": text_content,
+    }
+
+    if _worker_tasks:
+        try:
+            _email_queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Email queue full; sending inline")
+
+    return await send_email(**message)
+
 
 def is_email_configured() -> bool:
     """Check if email service is properly configured"""
@@ -45,132 +254,360 @@ async def send_email(
         logger.error("Email service not configured: BREVO_API_KEY and FROM_EMAIL required")
         return False
 
-    try:
-        # Prepare Brevo API request
-        headers = {
-            "accept": "application/json",
-            "api-key": BREVO_API_KEY,
-            "content-type": "application/json"
-        }
-
-        payload = {
-            "sender": {
-                "name": FROM_NAME,
-                "email": FROM_EMAIL
-            },
-            "to": [
-                {
-                    "email": to_email
-                }
-            ],
-            "subject": subject,
-            "htmlContent": html_content,
-            "textContent": text_content
-        }
-
-        # Send request to Brevo API
-        response = requests.post(
-            BREVO_API_URL,
-            json=payload,
-            headers=headers,
-            timeout=10
-        )
-
-        # Check response
-        if response.status_code == 201:
-            logger.info(f"Email sent successfully to {to_email} (Message ID: {response.json().get('messageId')})")
-            return True
-        else:
-            logger.error(f"Brevo API error ({response.status_code}): {response.text}")
-            return False
+    # Prepare Brevo API request; only the recipient and content vary.
+    payload = {
+        "sender": _BREVO_SENDER,
+        "to": [
+            {
+                "email": to_email
+            }
+        ],
+        "subject": subject,
+        "htmlContent": html_content,
+        "textContent": text_content
+    }
 
-    except requests.exceptions.Timeout:
-        logger.error("Brevo API request timed out")
-        return False
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Brevo API request failed: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error sending email: {e}")
-        return False
+    return await _post_payload(payload, f"to {to_email}")
 
 
-async def send_password_reset_email(
-    user_email: str,
-    user_name: str,
-    reset_token: str
+async def _send_email_batch(
+    recipients: list,
+    subject: str,
+    html_content: str,
+    text_content: str
 ) -> bool:
     """
-    Send password reset email with reset link
-
-    Args:
-        user_email: User's email address
-        user_name: User's full name
-        reset_token: Password reset token (not hashed)
+    Send one rendered message to several recipients in a single Brevo call.
 
-    Returns:
-        bool: True if email sent successfully
+    Uses the messageVersions form of the transactional endpoint: the shared
+    subject and bodies ride at the top level and each version carries one
+    recipient, so everyone still gets an individual email (no shared To/CC).
     """
-    reset_link = f"{FRONTEND_URL}/reset-password/{reset_token}"
+    if not is_email_configured():
+        logger.error("Email service not configured: BREVO_API_KEY and FROM_EMAIL required")
+        return False
+
+    payload = {
+        "sender": _BREVO_SENDER,
+        "subject": subject,
+        "htmlContent": html_content,
+        "textContent": text_content,
+        "messageVersions": [
+            {"to": [{"email": recipient}]} for recipient in recipients
+        ],
+    }
+
+    return await _post_payload(payload, f"to {len(recipients)} recipients")
+
 
-    subject = "Reset Your Splitwiser Password"
+async def _post_payload(payload: dict, description: str) -> bool:
+    """POST a prepared payload to Brevo with retries and the circuit breaker."""
+    global _breaker_failures
 
-    html_content = f"""
+    if time.monotonic() < _breaker_open_until:
+        logger.error(f"Brevo circuit open; failing email {description} fast")
+        return False
+
+    try:
+        # Serialize once up front with compact separators (the body is
+        # reused verbatim across retries, and the HTML content is the bulk
+        # of the payload), rather than letting httpx re-encode per attempt.
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+        # Send to Brevo (non-blocking; reuses pooled connections), retrying
+        # transient failures with jittered backoff between attempts.
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            transient_error = None
+            try:
+                async with _brevo_semaphore:
+                    response = await _client.post(
+                        BREVO_API_URL,
+                        content=body,
+                        headers=_BREVO_HEADERS
+                    )
+            except httpx.TimeoutException:
+                transient_error = "Brevo API request timed out"
+            except httpx.RequestError as e:
+                transient_error = f"Brevo API request failed: {e}"
+            else:
+                if response.status_code == 201:
+                    logger.info(f"Email sent successfully {description} (Message ID: {response.json().get('messageId')})")
+                    _breaker_failures = 0
+                    return True
+                if response.status_code not in _RETRYABLE_STATUS_CODES:
+                    # Permanent (auth/payload) error — retrying can't help.
+                    logger.error(f"Brevo API error ({response.status_code}): {response.text}")
+                    return False
+                transient_error = f"Brevo API error ({response.status_code}): {response.text}"
+
+            if attempt < _MAX_ATTEMPTS:
+                logger.warning(f"{transient_error} (attempt {attempt}/{_MAX_ATTEMPTS}, retrying)")
+                await asyncio.sleep(_backoff_delay(attempt))
+            else:
+                logger.error(f"{transient_error} (giving up after {_MAX_ATTEMPTS} attempts)")
+
+        _record_breaker_failure()
+        return False
+
+    except Exception as e:
+        logger.error(f"Unexpected error sending email: {e}")
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Message bodies.
+#
+# Every HTML email shares the same container/header/content/footer scaffold
+# and base CSS; only the header color, title, optional extra style rules and
+# the content block differ. The scaffold lives in one base template and each
+# message compiles its final Template once at import via _html_template():
+# safe_substitute() fills the static blocks immediately while leaving the
+# ${...} placeholders inside the content for the per-send substitute() call.
+# string.Template also keeps the CSS readable (no doubled braces the way
+# .format/f-strings require).
+# ---------------------------------------------------------------------------
+
+_BASE_HTML = Template("""\
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #4F46E5; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; background-color: #f9f9f9; }}
-            .button {{ display: inline-block; padding: 12px 24px; background-color: #4F46E5; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-            .link-text {{ word-break: break-all; color: #1E40AF; background-color: #EFF6FF; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 14px; }}
-            .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+            .header { background-color: ${header_color}; color: white; padding: 20px; text-align: center; }
+            .content { padding: 20px; background-color: #f9f9f9; }
+${extra_styles}            .footer { padding: 20px; text-align: center; font-size: 12px; color: #666; }
         </style>
     </head>
     <body>
         <div class="container">
             <div class="header">
-                <h1>Password Reset Request</h1>
+                <h1>${title}</h1>
             </div>
             <div class="content">
-                <p>Hi {user_name},</p>
-                <p>We received a request to reset your password for your Splitwiser account.</p>
-                <p>Click the button below to reset your password:</p>
-                <p style="text-align: center;">
-                    <a href="{reset_link}" class="button">Reset Password</a>
-                </p>
-                <p>Or copy and paste this link into your browser:</p>
-                <p class="link-text">{reset_link}</p>
-                <p><strong>This link will expire in 1 hour.</strong></p>
-                <p>If you didn't request a password reset, you can safely ignore this email. Your password will not be changed.</p>
+${content}
             </div>
             <div class="footer">
-                <p>This is an automated message from Splitwiser. Please do not reply to this email.</p>
+                <p>This is an automated ${message_kind} from Splitwiser. Please do not reply to this email.</p>
             </div>
         </div>
     </body>
     </html>
+    """)
+
+# Optional style rules, indented to slot into the base <style> block.
+_BUTTON_STYLE = "            .button { display: inline-block; padding: 12px 24px; background-color: #4F46E5; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }\n"
+_LINK_TEXT_STYLE = "            .link-text { word-break: break-all; color: #1E40AF; background-color: #EFF6FF; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 14px; }\n"
+_INFO_STYLE = "            .info { background-color: #EFF6FF; border-left: 4px solid #4F46E5; padding: 10px; margin: 20px 0; }\n"
+_SUCCESS_INFO_STYLE = "            .info { background-color: #F0FDF4; border-left: 4px solid #10B981; padding: 10px; margin: 20px 0; }\n"
+_WARNING_STYLE = "            .warning { background-color: #FEF2F2; border-left: 4px solid #EF4444; padding: 10px; margin: 20px 0; }\n"
+
+# Header colors: indigo for routine mail, red for security alerts, green for
+# success confirmations.
+_INDIGO = "#4F46E5"
+_RED = "#EF4444"
+_GREEN = "#10B981"
+
+
+def _html_template(
+    title: str,
+    content: str,
+    header_color: str = _INDIGO,
+    extra_styles: str = "",
+    message_kind: str = "message",
+) -> Template:
     """
+    Compile a message's final HTML Template from the shared base.
 
-    text_content = f"""
-Hi {user_name},
+    The static fields are substituted once here (at import); placeholders
+    inside ``content`` survive for the per-send substitute() call.
+    """
+    return Template(_BASE_HTML.safe_substitute(
+        title=title,
+        content=content,
+        header_color=header_color,
+        extra_styles=extra_styles,
+        message_kind=message_kind,
+    ))
+
+
+# The plain-text sibling of each message is derived from the same HTML
+# content block at import, so the wording has a single source of truth and
+# the two versions can't drift. The conversion drops the redundant
+# "copy and paste" paragraph (the button link becomes the plain link),
+# turns list items into "- " bullets, strips the remaining tags and
+# re-attaches the footer line. ${...} placeholders pass through untouched.
+_COPY_PASTE_BLOCK_RE = re.compile(
+    r'<p>Or copy and paste this link into your browser:</p>\s*'
+    r'<p class="link-text">.*?</p>',
+    re.S,
+)
+_BUTTON_LINK_RE = re.compile(r'<a href="(.*?)" class="button">.*?</a>', re.S)
+_LIST_ITEM_RE = re.compile(r'<li>(.*?)</li>', re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _text_template(content: str, message_kind: str = "message") -> Template:
+    """Derive a message's plain-text Template from its HTML content block."""
+    text = _COPY_PASTE_BLOCK_RE.sub("", content)
+    text = _BUTTON_LINK_RE.sub(r"\1", text)
+    text = text.replace("button below", "link below")
+    text = _LIST_ITEM_RE.sub(r"- \1", text)
+    text = _TAG_RE.sub("", text)
+
+    paragraphs = [line.strip() for line in text.splitlines() if line.strip()]
+    parts = []
+    previous_was_bullet = False
+    for paragraph in paragraphs:
+        is_bullet = paragraph.startswith("- ")
+        if parts:
+            # Blank line between paragraphs; bullets stay adjacent.
+            parts.append("\n" if is_bullet and previous_was_bullet else "\n\n")
+        parts.append(paragraph)
+        previous_was_bullet = is_bullet
+
+    body = "".join(parts)
+    footer = "---\nThis is an automated " + message_kind + " from Splitwiser.\n"
+    return Template("\n" + body + "\n\n" + footer)
+
+
+_PASSWORD_RESET_CONTENT = """\
+                <p>Hi ${user_name},</p>
+                <p>We received a request to reset your password for your Splitwiser account.</p>
+                <p>Click the button below to reset your password:</p>
+                <p style="text-align: center;">
+                    <a href="${reset_link}" class="button">Reset Password</a>
+                </p>
+                <p>Or copy and paste this link into your browser:</p>
+                <p class="link-text">${reset_link}</p>
+                <p><strong>This link will expire in 1 hour.</strong></p>
+                <p>If you didn't request a password reset, you can safely ignore this email. Your password will not be changed.</p>"""
+
+_PASSWORD_RESET_HTML = _html_template(
+    title="Password Reset Request",
+    extra_styles=_BUTTON_STYLE + _LINK_TEXT_STYLE,
+    content=_PASSWORD_RESET_CONTENT,
+)
+
+_PASSWORD_RESET_TEXT = _text_template(_PASSWORD_RESET_CONTENT)
+
+_EMAIL_VERIFICATION_CONTENT = """\
+                <p>Hi ${user_name},</p>
+                <p>Please verify your new email address for your Splitwiser account.</p>
+                <p>Click the button below to verify this email address:</p>
+                <p style="text-align: center;">
+                    <a href="${verification_link}" class="button">Verify Email</a>
+                </p>
+                <p>Or copy and paste this link into your browser:</p>
+                <p class="link-text">${verification_link}</p>
+                <p><strong>This link will expire in 24 hours.</strong></p>
+                <p>If you didn't request this email change, please contact support immediately.</p>"""
+
+_EMAIL_VERIFICATION_HTML = _html_template(
+    title="Verify Your Email Address",
+    extra_styles=_BUTTON_STYLE + _LINK_TEXT_STYLE,
+    content=_EMAIL_VERIFICATION_CONTENT,
+)
+
+_EMAIL_VERIFICATION_TEXT = _text_template(_EMAIL_VERIFICATION_CONTENT)
+
+_EMAIL_CHANGE_NOTIFICATION_CONTENT = """\
+                <p>Hi ${user_name},</p>
+                <p>This is a security notification that the email address for your Splitwiser account has been changed.</p>
+                <div class="warning">
+                    <strong>New email address:</strong> ${masked_email}
+                </div>
+                <p>If you made this change, you can safely ignore this email.</p>
+                <p><strong>If you did NOT make this change:</strong></p>
+                <ul>
+                    <li>Your account may have been compromised</li>
+                    <li>Contact support immediately</li>
+                    <li>Change your password on all accounts that share the same password</li>
+                </ul>"""
+
+_EMAIL_CHANGE_NOTIFICATION_HTML = _html_template(
+    title="Security Alert",
+    header_color=_RED,
+    extra_styles=_WARNING_STYLE,
+    message_kind="security message",
+    content=_EMAIL_CHANGE_NOTIFICATION_CONTENT,
+)
+
+_EMAIL_CHANGE_NOTIFICATION_TEXT = _text_template(
+    _EMAIL_CHANGE_NOTIFICATION_CONTENT, message_kind="security message"
+)
+
+_PASSWORD_CHANGED_CONTENT = """\
+                <p>Hi ${user_name},</p>
+                <p>This is a confirmation that your Splitwiser account password has been changed successfully.</p>
+                <div class="info">
+                    <p>For your security, you have been logged out of all other devices.</p>
+                </div>
+                <p>If you made this change, you can safely ignore this email.</p>
+                <p><strong>If you did NOT make this change:</strong></p>
+                <ul>
+                    <li>Your account may have been compromised</li>
+                    <li>Contact support immediately</li>
+                    <li>Use the "Forgot Password" feature to reset your password</li>
+                </ul>"""
+
+_PASSWORD_CHANGED_HTML = _html_template(
+    title="Password Changed Successfully",
+    header_color=_GREEN,
+    extra_styles=_SUCCESS_INFO_STYLE,
+    message_kind="security message",
+    content=_PASSWORD_CHANGED_CONTENT,
+)
+
+_PASSWORD_CHANGED_TEXT = _text_template(
+    _PASSWORD_CHANGED_CONTENT, message_kind="security message"
+)
+
+_FRIEND_REQUEST_CONTENT = """\
+                <p>Hi ${to_name},</p>
+                <p><strong>${from_name}</strong> has sent you a friend request on Splitwiser!</p>
+                <div class="info">
+                    <p>Adding friends makes it easy to split expenses and keep track of who owes what.</p>
+                </div>
+                <p>Click the button below to view and respond to the request:</p>
+                <p style="text-align: center;">
+                    <a href="${friend_requests_link}" class="button">View Friend Request</a>
+                </p>
+                <p>Or copy and paste this link into your browser:</p>
+                <p class="link-text">${friend_requests_link}</p>"""
 
-We received a request to reset your password for your Splitwiser account.
+_FRIEND_REQUEST_HTML = _html_template(
+    title="New Friend Request",
+    extra_styles=_BUTTON_STYLE + _INFO_STYLE + _LINK_TEXT_STYLE,
+    content=_FRIEND_REQUEST_CONTENT,
+)
 
-Click the link below to reset your password:
-{reset_link}
+_FRIEND_REQUEST_TEXT = _text_template(_FRIEND_REQUEST_CONTENT)
 
-This link will expire in 1 hour.
 
-If you didn't request a password reset, you can safely ignore this email. Your password will not be changed.
+async def send_password_reset_email(
+    user_email: str,
+    user_name: str,
+    reset_token: str
+) -> bool:
+    """
+    Send password reset email with reset link
+
+    Args:
+        user_email: User's email address
+        user_name: User's full name
+        reset_token: Password reset token (not hashed)
 
----
-This is an automated message from Splitwiser.
+    Returns:
+        bool: True if email sent successfully
     """
+    reset_link = _RESET_URL_PREFIX + reset_token
+
+    subject = _PASSWORD_RESET_SUBJECT
+    html_content = _PASSWORD_RESET_HTML.substitute(user_name=user_name, reset_link=reset_link)
+    text_content = _PASSWORD_RESET_TEXT.substitute(user_name=user_name, reset_link=reset_link)
 
-    return await send_email(user_email, subject, html_content, text_content)
+    return await queue_email(user_email, subject, html_content, text_content)
 
 
 async def send_email_verification_email(
@@ -191,66 +628,17 @@ async def send_email_verification_email(
     Returns:
         bool: True if email sent successfully
     """
-    verification_link = f"{FRONTEND_URL}/verify-email/{verification_token}"
+    verification_link = _VERIFY_URL_PREFIX + verification_token
 
-    subject = "Verify Your New Email Address - Splitwiser"
+    subject = _EMAIL_VERIFICATION_SUBJECT
+    html_content = _EMAIL_VERIFICATION_HTML.substitute(
+        user_name=user_name, verification_link=verification_link
+    )
+    text_content = _EMAIL_VERIFICATION_TEXT.substitute(
+        user_name=user_name, verification_link=verification_link
+    )
 
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #4F46E5; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; background-color: #f9f9f9; }}
-            .button {{ display: inline-block; padding: 12px 24px; background-color: #4F46E5; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-            .link-text {{ word-break: break-all; color: #1E40AF; background-color: #EFF6FF; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 14px; }}
-            .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>Verify Your Email Address</h1>
-            </div>
-            <div class="content">
-                <p>Hi {user_name},</p>
-                <p>Please verify your new email address for your Splitwiser account.</p>
-                <p>Click the button below to verify this email address:</p>
-                <p style="text-align: center;">
-                    <a href="{verification_link}" class="button">Verify Email</a>
-                </p>
-                <p>Or copy and paste this link into your browser:</p>
-                <p class="link-text">{verification_link}</p>
-                <p><strong>This link will expire in 24 hours.</strong></p>
-                <p>If you didn't request this email change, please contact support immediately.</p>
-            </div>
-            <div class="footer">
-                <p>This is an automated message from Splitwiser. Please do not reply to this email.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    text_content = f"""
-Hi {user_name},
-
-Please verify your new email address for your Splitwiser account.
-
-Click the link below to verify this email address:
-{verification_link}
-
-This link will expire in 24 hours.
-
-If you didn't request this email change, please contact support immediately.
-
----
-This is an automated message from Splitwiser.
-    """
-
-    return await send_email(new_email, subject, html_content, text_content)
+    return await queue_email(new_email, subject, html_content, text_content)
 
 
 async def send_email_change_notification(
@@ -276,69 +664,15 @@ async def send_email_change_notification(
     else:
         masked_email = "***"
 
-    subject = "Your Splitwiser Email Address Has Been Changed"
-
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #EF4444; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; background-color: #f9f9f9; }}
-            .warning {{ background-color: #FEF2F2; border-left: 4px solid #EF4444; padding: 10px; margin: 20px 0; }}
-            .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>Security Alert</h1>
-            </div>
-            <div class="content">
-                <p>Hi {user_name},</p>
-                <p>This is a security notification that the email address for your Splitwiser account has been changed.</p>
-                <div class="warning">
-                    <strong>New email address:</strong> {masked_email}
-                </div>
-                <p>If you made this change, you can safely ignore this email.</p>
-                <p><strong>If you did NOT make this change:</strong></p>
-                <ul>
-                    <li>Your account may have been compromised</li>
-                    <li>Contact support immediately</li>
-                    <li>Change your password on all accounts that share the same password</li>
-                </ul>
-            </div>
-            <div class="footer">
-                <p>This is an automated security message from Splitwiser. Please do not reply to this email.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    text_content = f"""
-Hi {user_name},
-
-SECURITY ALERT
-
-This is a security notification that the email address for your Splitwiser account has been changed.
-
-New email address: {masked_email}
+    subject = _EMAIL_CHANGE_SUBJECT
+    html_content = _EMAIL_CHANGE_NOTIFICATION_HTML.substitute(
+        user_name=user_name, masked_email=masked_email
+    )
+    text_content = _EMAIL_CHANGE_NOTIFICATION_TEXT.substitute(
+        user_name=user_name, masked_email=masked_email
+    )
 
-If you made this change, you can safely ignore this email.
-
-If you did NOT make this change:
-- Your account may have been compromised
-- Contact support immediately
-- Change your password on all accounts that share the same password
-
----
-This is an automated security message from Splitwiser.
-    """
-
-    return await send_email(old_email, subject, html_content, text_content)
+    return await queue_email(old_email, subject, html_content, text_content)
 
 
 async def send_password_changed_notification(
@@ -355,67 +689,11 @@ async def send_password_changed_notification(
     Returns:
         bool: True if email sent successfully
     """
-    subject = "Your Splitwiser Password Has Been Changed"
+    subject = _PASSWORD_CHANGED_SUBJECT
+    html_content = _PASSWORD_CHANGED_HTML.substitute(user_name=user_name)
+    text_content = _PASSWORD_CHANGED_TEXT.substitute(user_name=user_name)
 
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #10B981; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; background-color: #f9f9f9; }}
-            .info {{ background-color: #F0FDF4; border-left: 4px solid #10B981; padding: 10px; margin: 20px 0; }}
-            .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>Password Changed Successfully</h1>
-            </div>
-            <div class="content">
-                <p>Hi {user_name},</p>
-                <p>This is a confirmation that your Splitwiser account password has been changed successfully.</p>
-                <div class="info">
-                    <p>For your security, you have been logged out of all other devices.</p>
-                </div>
-                <p>If you made this change, you can safely ignore this email.</p>
-                <p><strong>If you did NOT make this change:</strong></p>
-                <ul>
-                    <li>Your account may have been compromised</li>
-                    <li>Contact support immediately</li>
-                    <li>Use the "Forgot Password" feature to reset your password</li>
-                </ul>
-            </div>
-            <div class="footer">
-                <p>This is an automated security message from Splitwiser. Please do not reply to this email.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    text_content = f"""
-Hi {user_name},
-
-This is a confirmation that your Splitwiser account password has been changed successfully.
-
-For your security, you have been logged out of all other devices.
-
-If you made this change, you can safely ignore this email.
-
-If you did NOT make this change:
-- Your account may have been compromised
-- Contact support immediately
-- Use the "Forgot Password" feature to reset your password
-
----
-This is an automated security message from Splitwiser.
-    """
-
-    return await send_email(user_email, subject, html_content, text_content)
+    return await queue_email(user_email, subject, html_content, text_content)
 
 
 async def send_friend_request_email(
@@ -434,63 +712,14 @@ async def send_friend_request_email(
     Returns:
         bool: True if email sent successfully
     """
-    friend_requests_link = f"{FRONTEND_URL}/account"
+    friend_requests_link = _ACCOUNT_URL
 
     subject = f"{from_name} sent you a friend request on Splitwiser"
-
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #4F46E5; color: white; padding: 20px; text-align: center; }}
-            .content {{ padding: 20px; background-color: #f9f9f9; }}
-            .button {{ display: inline-block; padding: 12px 24px; background-color: #4F46E5; color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-            .info {{ background-color: #EFF6FF; border-left: 4px solid #4F46E5; padding: 10px; margin: 20px 0; }}
-            .link-text {{ word-break: break-all; color: #1E40AF; background-color: #EFF6FF; padding: 12px; border-radius: 4px; font-family: monospace; font-size: 14px; }}
-            .footer {{ padding: 20px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>New Friend Request</h1>
-            </div>
-            <div class="content">
-                <p>Hi {to_name},</p>
-                <p><strong>{from_name}</strong> has sent you a friend request on Splitwiser!</p>
-                <div class="info">
-                    <p>Adding friends makes it easy to split expenses and keep track of who owes what.</p>
-                </div>
-                <p>Click the button below to view and respond to the request:</p>
-                <p style="text-align: center;">
-                    <a href="{friend_requests_link}" class="button">View Friend Request</a>
-                </p>
-                <p>Or copy and paste this link into your browser:</p>
-                <p class="link-text">{friend_requests_link}</p>
-            </div>
-            <div class="footer">
-                <p>This is an automated message from Splitwiser. Please do not reply to this email.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-    text_content = f"""
-Hi {to_name},
-
-{from_name} has sent you a friend request on Splitwiser!
-
-Adding friends makes it easy to split expenses and keep track of who owes what.
-
-Click the link below to view and respond to the request:
-{friend_requests_link}
-
----
-This is an automated message from Splitwiser.
-    """
-
-    return await send_email(to_email, subject, html_content, text_content)
+    html_content = _FRIEND_REQUEST_HTML.substitute(
+        to_name=to_name, from_name=from_name, friend_requests_link=friend_requests_link
+    )
+    text_content = _FRIEND_REQUEST_TEXT.substitute(
+        to_name=to_name, from_name=from_name, friend_requests_link=friend_requests_link
+    )
+
+    return await queue_email(to_email, subject, html_content, text_content)
@@ -1,15 +1,26 @@
 from fastapi import Request, HTTPException, status
 import time
-from collections import defaultdict
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Tuple
 
 class RateLimiter:
+    """Token-bucket rate limiter keyed by client IP.
+
+    Each IP holds a bucket of up to requests_limit tokens that refills
+    continuously at requests_limit / time_window tokens per second. A
+    request spends one token; an empty bucket means 429. State per IP is
+    just (tokens, last_refill) — two floats regardless of the limit,
+    unlike a sliding-window log whose memory grows with requests_limit.
+    """
+
     def __init__(self, requests_limit: int, time_window: int):
         self.requests_limit = requests_limit
         self.time_window = time_window  # in seconds
-        self.ip_requests: Dict[str, List[float]] = defaultdict(list)
-        self.cleanup_interval = 600  # Cleanup every 10 minutes
-        self.last_cleanup = time.time()
+        self.refill_rate = requests_limit / time_window  # tokens per second
+        # Ordered by last refill (entries are moved to the end on every
+        # hit), so stale buckets accumulate at the front for eviction.
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.max_evictions_per_call = 4
 
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -19,47 +30,63 @@ class RateLimiter:
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
             # X-Forwarded-For: <client>, <proxy1>, <proxy2>
-            # We want the first one (the client)
-            return forwarded_for.split(",")[0].strip()
+            # We want the first one (the client); partition avoids building
+            # a list of every proxy hop just to take the head.
+            return forwarded_for.partition(",")[0].strip()
 
         return request.client.host or "127.0.0.1"
 
     async def __call__(self, request: Request):
-        client_ip = self._get_client_ip(request)
-        current_time = time.time()
-
-        # Periodic cleanup to prevent memory leaks
-        if current_time - self.last_cleanup > self.cleanup_interval:
-            self._cleanup(current_time)
-            self.last_cleanup = current_time
-
-        # Get requests for this IP
-        request_times = self.ip_requests[client_ip]
-
-        # Filter out requests older than the time window
-        request_times = [t for t in request_times if current_time - t < self.time_window]
-        self.ip_requests[client_ip] = request_times
-
-        if len(request_times) >= self.requests_limit:
+        # Endpoints often stack several limiters as dependencies; parse the
+        # forwarded header once per request and share it via request.state.
+        client_ip = getattr(request.state, "client_ip", None)
+        if client_ip is None:
+            client_ip = self._get_client_ip(request)
+            request.state.client_ip = client_ip
+
+        # Likewise read the clock once per request: every limiter in the
+        # dependency stack sees the same instant.
+        current_time = getattr(request.state, "rate_limit_now", None)
+        if current_time is None:
+            current_time = time.monotonic()
+            request.state.rate_limit_now = current_time
+
+        # Amortized cleanup: evict a few of the stalest buckets per call
+        # instead of sweeping the whole dict on a timer.
+        self._evict_stale(current_time)
+
+        tokens, last_refill = self.buckets.get(
+            client_ip, (float(self.requests_limit), current_time)
+        )
+        tokens = min(
+            float(self.requests_limit),
+            tokens + (current_time - last_refill) * self.refill_rate,
+        )
+
+        if tokens < 1.0:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many requests. Please try again later."
             )
 
-        # Add current request timestamp
-        self.ip_requests[client_ip].append(current_time)
+        self.buckets[client_ip] = (tokens - 1.0, current_time)
+        self.buckets.move_to_end(client_ip)
         return True
 
-    def _cleanup(self, current_time: float):
-        """Remove IP entries that haven't made requests recently"""
-        ips_to_remove = []
-        for ip, timestamps in self.ip_requests.items():
-            # If the newest timestamp is older than the time window, the IP can be removed
-            if not timestamps or (current_time - timestamps[-1] > self.time_window):
-                ips_to_remove.append(ip)
+    def _evict_stale(self, current_time: float):
+        """Drop a bounded number of long-idle IP entries from the front.
 
-        for ip in ips_to_remove:
-            del self.ip_requests[ip]
+        A bucket untouched for a full window has refilled completely, so
+        dropping it is indistinguishable from keeping it. Capping evictions
+        per call keeps the work O(1) instead of a stop-the-world sweep.
+        """
+        for _ in range(self.max_evictions_per_call):
+            if not self.buckets:
+                return
+            ip, (_, last_refill) = next(iter(self.buckets.items()))
+            if current_time - last_refill <= self.time_window:
+                return
+            del self.buckets[ip]
 
 # Create specific rate limiters
 # 5 requests per minute for sensitive auth operations
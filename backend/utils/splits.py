@@ -1,170 +1,153 @@
 """Split calculation utilities for itemized expenses."""
 
+from collections import defaultdict
 from typing import Dict, Tuple
 import schemas
 
 
-def get_assignment_key(assignment: schemas.ItemAssignment) -> str:
-    """Get a unique key for an assignment (user, group guest, or expense guest)."""
+def get_assignment_key(assignment: schemas.ItemAssignment) -> Tuple[str, object]:
+    """Get a unique (kind, id) key for an assignment (user, group guest, or expense guest).
+
+    Structured tuples instead of "user_3"-style strings: the final
+    conversion reads the kind and id directly rather than re-parsing a
+    string we encoded ourselves. Expense-guest ids are stringified so the
+    id component stays comparable when temp ids and DB ids mix in a sort.
+    """
     if assignment.temp_guest_id is not None:
-        return f"expense_guest_{assignment.temp_guest_id}"
+        return ("expense_guest", str(assignment.temp_guest_id))
     elif assignment.expense_guest_id is not None:
-        return f"expense_guest_{assignment.expense_guest_id}"
+        return ("expense_guest", str(assignment.expense_guest_id))
     elif assignment.is_guest:
-        return f"guest_{assignment.user_id}"
+        return ("guest", assignment.user_id)
     else:
-        return f"user_{assignment.user_id}"
+        return ("user", assignment.user_id)
 
 
-def calculate_itemized_splits(items: list[schemas.ExpenseItemCreate]) -> list[schemas.ExpenseSplitBase]:
-    """
-    Calculate each person's share based on assigned items.
+def _parse_detail_key(key: str) -> Tuple[str, object]:
+    """Map a client-side "user_3"/"guest_4"/"expense_guest_x" detail key to tuple form."""
+    if key.startswith("user_"):
+        id_part = key[5:]
+    elif key.startswith("guest_"):
+        id_part = key[6:]
+    elif key.startswith("expense_guest_"):
+        return ("expense_guest", key[14:])
+    else:
+        # Unknown shape: return it unmatched, as such entries were ignored
+        # under the old string keys too.
+        return ("?", key)
+    try:
+        return (key.partition("_")[0], int(id_part))
+    except ValueError:
+        return ("?", key)
 
-    Algorithm:
-    1. Sum each person's assigned items (shared items split equally)
-    2. Calculate subtotal for all non-tax/tip items
-    3. Distribute tax/tip proportionally to each person's subtotal
-    4. Return final splits
-    """
-    # Track each person's subtotal (key: "user_<id>" or "guest_<id>")
-    person_subtotals = {}
 
-    # Separate regular items from tax/tip
-    regular_items = [i for i in items if not i.is_tax_tip]
-    tax_tip_items = [i for i in items if i.is_tax_tip]
+# Detail tuple layout: (amount, percentage, shares). Used when a key has no
+# entry in split_details, matching the old per-branch fallbacks.
+_NO_DETAIL = (0, 0, 1)
 
-    # Process regular items
-    for item in regular_items:
-        if not item.assignments:
-            continue
 
-        split_type = getattr(item, 'split_type', 'EQUAL')
-        split_details = getattr(item, 'split_details', {}) or {}
-
-        if split_type == 'EQUAL' or len(item.assignments) == 1:
-            # Equal split among assignees (or single assignee gets everything)
-            num_assignees = len(item.assignments)
-            share_per_person = item.price // num_assignees
-            remainder = item.price % num_assignees
-
-            for idx, assignment in enumerate(item.assignments):
-                key = f"{'guest' if assignment.is_guest else 'user'}_{assignment.user_id}"
-                # First assignee gets the remainder cents
-                amount = share_per_person + (1 if idx < remainder else 0)
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'EXACT':
-            # Use exact amounts specified
-            for assignment in item.assignments:
-                key = f"{'guest' if assignment.is_guest else 'user'}_{assignment.user_id}"
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'amount'):
-                    amount = detail.amount or 0
-                elif isinstance(detail, dict):
-                    amount = detail.get('amount', 0)
-                else:
-                    amount = 0
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'PERCENT':
-            # Use percentages specified
-            remaining = item.price
-            sorted_assignments = sorted(item.assignments, key=lambda a: f"{'guest' if a.is_guest else 'user'}_{a.user_id}")
-
-            for idx, assignment in enumerate(sorted_assignments):
-                key = f"{'guest' if assignment.is_guest else 'user'}_{assignment.user_id}"
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'percentage'):
-                    percentage = detail.percentage or 0
-                elif isinstance(detail, dict):
-                    percentage = detail.get('percentage', 0)
-                else:
-                    percentage = 0
-
-                if idx == len(sorted_assignments) - 1:
-                    # Last person gets remainder
-                    amount = remaining
-                else:
-                    amount = int(item.price * (percentage / 100))
-                    remaining -= amount
-
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'SHARES':
-            # Calculate based on shares
-            total_shares = 0
-            for assignment in item.assignments:
-                key = f"{'guest' if assignment.is_guest else 'user'}_{assignment.user_id}"
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'shares'):
-                    shares = detail.shares or 1
-                elif isinstance(detail, dict):
-                    shares = detail.get('shares', 1)
-                else:
-                    shares = 1
-                total_shares += shares
-
-            if total_shares > 0:
-                remaining = item.price
-                sorted_assignments = sorted(item.assignments, key=lambda a: f"{'guest' if a.is_guest else 'user'}_{a.user_id}")
-
-                for idx, assignment in enumerate(sorted_assignments):
-                    key = f"{'guest' if assignment.is_guest else 'user'}_{assignment.user_id}"
-                    detail = split_details.get(key, {})
-                    # Handle both dict and ItemSplitDetail object
-                    if hasattr(detail, 'shares'):
-                        shares = detail.shares or 1
-                    elif isinstance(detail, dict):
-                        shares = detail.get('shares', 1)
-                    else:
-                        shares = 1
-
-                    if idx == len(sorted_assignments) - 1:
-                        # Last person gets remainder
-                        amount = remaining
-                    else:
-                        amount = int((item.price * shares) / total_shares)
-                        remaining -= amount
-
-                    person_subtotals[key] = person_subtotals.get(key, 0) + amount
+def _split_equal(price: int, keys: list, details: dict, person_subtotals: dict) -> None:
+    """Equal split among assignees (or single assignee gets everything)."""
+    share_per_person, remainder = divmod(price, len(keys))
+    for idx, key in enumerate(keys):
+        # First assignees get the remainder cents
+        person_subtotals[key] += share_per_person + (1 if idx < remainder else 0)
 
-    # Calculate total of regular items for proportional distribution
-    regular_total = sum(person_subtotals.values())
-    tax_tip_total = sum(i.price for i in tax_tip_items)
 
-    # Distribute tax/tip proportionally
-    person_totals = {}
-    remaining_tax_tip = tax_tip_total
+def _split_exact(price: int, keys: list, details: dict, person_subtotals: dict) -> None:
+    """Use exact amounts specified."""
+    for key in keys:
+        person_subtotals[key] += details.get(key, _NO_DETAIL)[0]
 
-    sorted_keys = sorted(person_subtotals.keys())
-    for idx, key in enumerate(sorted_keys):
-        subtotal = person_subtotals[key]
-        person_totals[key] = subtotal
 
-        if regular_total > 0 and tax_tip_total > 0:
-            if idx == len(sorted_keys) - 1:
-                # Last person gets remainder to avoid rounding errors
-                tax_tip_share = remaining_tax_tip
-            else:
-                tax_tip_share = int((subtotal / regular_total) * tax_tip_total)
-                remaining_tax_tip -= tax_tip_share
+def _split_percent(price: int, keys: list, details: dict, person_subtotals: dict) -> None:
+    """Use percentages specified; last person (in key order) gets the remainder."""
+    remaining = price
+    ordered_keys = sorted(keys)
+    last_idx = len(ordered_keys) - 1
+
+    for idx, key in enumerate(ordered_keys):
+        if idx == last_idx:
+            amount = remaining
+        else:
+            percentage = details.get(key, _NO_DETAIL)[1]
+            amount = int(price * (percentage / 100))
+            remaining -= amount
 
-            person_totals[key] += tax_tip_share
+        person_subtotals[key] += amount
 
-    # Convert to ExpenseSplitBase list
-    splits = []
-    for key, amount in person_totals.items():
-        is_guest = key.startswith("guest_")
-        user_id = int(key.split("_")[1])
-        splits.append(schemas.ExpenseSplitBase(
-            user_id=user_id,
-            is_guest=is_guest,
-            amount_owed=amount
-        ))
 
+def _split_shares(price: int, keys: list, details: dict, person_subtotals: dict) -> None:
+    """Split proportionally to shares; last person (in key order) gets the remainder."""
+    # Extract each key's share count once and carry it into the
+    # distribution pass rather than looking the detail up again there.
+    share_values = [details.get(key, _NO_DETAIL)[2] for key in keys]
+    total_shares = sum(share_values)
+
+    if total_shares <= 0:
+        return
+
+    remaining = price
+    ordered = sorted(zip(keys, share_values))
+    last_idx = len(ordered) - 1
+
+    for idx, (key, shares) in enumerate(ordered):
+        if idx == last_idx:
+            amount = remaining
+        else:
+            amount = int((price * shares) / total_shares)
+            remaining -= amount
+
+        person_subtotals[key] += amount
+
+
+# Dispatch on split_type in O(1) instead of walking an if/elif chain that
+# compares up to four strings per item. Unknown types fall back to EQUAL
+# (the schema default) rather than silently dropping the item.
+_SPLIT_FUNCS = {
+    'EQUAL': _split_equal,
+    'EXACT': _split_exact,
+    'PERCENT': _split_percent,
+    'SHARES': _split_shares,
+}
+
+
+def _normalize_details(split_details: dict) -> dict:
+    """Flatten detail values to (amount, percentage, shares) tuples.
+
+    Details arrive either as ItemSplitDetail objects or plain dicts; the
+    split branches used to re-probe which shape each value had on every
+    assignment. Normalizing once per item leaves a single dict lookup in
+    the hot loops.
+    """
+    normalized = {}
+    for raw_key, detail in split_details.items():
+        key = _parse_detail_key(raw_key)
+        if isinstance(detail, dict):
+            normalized[key] = (
+                detail.get('amount', 0),
+                detail.get('percentage', 0),
+                detail.get('shares', 1),
+            )
+        else:
+            normalized[key] = (
+                getattr(detail, 'amount', None) or 0,
+                getattr(detail, 'percentage', None) or 0,
+                getattr(detail, 'shares', None) or 1,
+            )
+    return normalized
+
+
+def calculate_itemized_splits(items: list[schemas.ExpenseItemCreate]) -> list[schemas.ExpenseSplitBase]:
+    """
+    Calculate each person's share based on assigned items.
+
+    Thin wrapper over calculate_itemized_splits_with_expense_guests for
+    callers whose items carry no expense guests: the full variant handles
+    assignments without temp/expense-guest ids identically, so keeping a
+    second copy of the algorithm only duplicated maintenance.
+    """
+    splits, _ = calculate_itemized_splits_with_expense_guests(items)
     return splits
 
 
@@ -178,151 +161,93 @@ def calculate_itemized_splits_with_expense_guests(
         - List of ExpenseSplitBase for registered users and group guests
         - Dict mapping temp_guest_id to amount_owed for expense guests
     """
-    # Track each person's subtotal (key: "user_<id>", "guest_<id>", or "expense_guest_<temp_id>")
-    person_subtotals = {}
+    # Track each person's subtotal (key: ("user", id), ("guest", id), or ("expense_guest", temp_id))
+    person_subtotals = defaultdict(int)
+
+    # Single pass: tax/tip items only contribute their price to the total
+    # to distribute, everything else flows through the split branches.
+    tax_tip_total = 0
 
-    # Separate regular items from tax/tip
-    regular_items = [i for i in items if not i.is_tax_tip]
-    tax_tip_items = [i for i in items if i.is_tax_tip]
+    for item in items:
+        if item.is_tax_tip:
+            tax_tip_total += item.price
+            continue
 
-    # Process regular items
-    for item in regular_items:
-        if not item.assignments:
+        # Locals for the fields the branches hit repeatedly; pydantic
+        # attribute access goes through the descriptor protocol each time.
+        assignments = item.assignments
+        if not assignments:
             continue
+        price = item.price
+
+        # Direct attribute access: split_type/split_details are required
+        # fields with defaults on ExpenseItemCreate, so the getattr-with-
+        # default dance for older payload shapes is no longer needed.
+        split_type = item.split_type
+        details = _normalize_details(item.split_details)
 
-        split_type = getattr(item, 'split_type', 'EQUAL')
-        split_details = getattr(item, 'split_details', {}) or {}
-
-        if split_type == 'EQUAL' or len(item.assignments) == 1:
-            # Equal split among assignees (or single assignee gets everything)
-            num_assignees = len(item.assignments)
-            share_per_person = item.price // num_assignees
-            remainder = item.price % num_assignees
-
-            for idx, assignment in enumerate(item.assignments):
-                key = get_assignment_key(assignment)
-                # First assignee gets the remainder cents
-                amount = share_per_person + (1 if idx < remainder else 0)
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'EXACT':
-            # Use exact amounts specified
-            for assignment in item.assignments:
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                if hasattr(detail, 'amount'):
-                    amount = detail.amount or 0
-                elif isinstance(detail, dict):
-                    amount = detail.get('amount', 0)
-                else:
-                    amount = 0
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'PERCENT':
-            # Use percentages specified
-            remaining = item.price
-            sorted_assignments = sorted(item.assignments, key=lambda a: get_assignment_key(a))
-
-            for idx, assignment in enumerate(sorted_assignments):
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                if hasattr(detail, 'percentage'):
-                    percentage = detail.percentage or 0
-                elif isinstance(detail, dict):
-                    percentage = detail.get('percentage', 0)
-                else:
-                    percentage = 0
-
-                if idx == len(sorted_assignments) - 1:
-                    amount = remaining
-                else:
-                    amount = int(item.price * (percentage / 100))
-                    remaining -= amount
-
-                person_subtotals[key] = person_subtotals.get(key, 0) + amount
-
-        elif split_type == 'SHARES':
-            # Calculate based on shares
-            total_shares = 0
-            for assignment in item.assignments:
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                if hasattr(detail, 'shares'):
-                    shares = detail.shares or 1
-                elif isinstance(detail, dict):
-                    shares = detail.get('shares', 1)
-                else:
-                    shares = 1
-                total_shares += shares
-
-            if total_shares > 0:
-                remaining = item.price
-                sorted_assignments = sorted(item.assignments, key=lambda a: get_assignment_key(a))
-
-                for idx, assignment in enumerate(sorted_assignments):
-                    key = get_assignment_key(assignment)
-                    detail = split_details.get(key, {})
-                    if hasattr(detail, 'shares'):
-                        shares = detail.shares or 1
-                    elif isinstance(detail, dict):
-                        shares = detail.get('shares', 1)
-                    else:
-                        shares = 1
-
-                    if idx == len(sorted_assignments) - 1:
-                        amount = remaining
-                    else:
-                        amount = int((item.price * shares) / total_shares)
-                        remaining -= amount
-
-                    person_subtotals[key] = person_subtotals.get(key, 0) + amount
+        # Build each assignment's key exactly once; the split helpers (and
+        # their sorts) would otherwise rebuild the same key repeatedly.
+        keys = [get_assignment_key(a) for a in assignments]
+
+        # A single assignee gets everything regardless of split type.
+        if len(keys) == 1:
+            split_func = _split_equal
+        else:
+            split_func = _SPLIT_FUNCS.get(split_type, _split_equal)
+        split_func(price, keys, details, person_subtotals)
 
     # Calculate total of regular items for proportional distribution
     regular_total = sum(person_subtotals.values())
-    tax_tip_total = sum(i.price for i in tax_tip_items)
 
-    # Distribute tax/tip proportionally
-    person_totals = {}
-    remaining_tax_tip = tax_tip_total
+    # Distribute tax/tip proportionally. Most itemized receipts have no
+    # separate tax/tip line, so skip the sort-and-distribute stage outright
+    # rather than running it with a guard that only skips the arithmetic.
+    if tax_tip_total == 0 or not person_subtotals:
+        person_totals = dict(person_subtotals)
+    elif regular_total == 0:
+        # All regular items were zero-priced; fall back to an equal split of
+        # the tax/tip so it isn't silently dropped.
+        person_totals = {}
+        share, remainder = divmod(tax_tip_total, len(person_subtotals))
+        for idx, key in enumerate(sorted(person_subtotals)):
+            person_totals[key] = share + (1 if idx < remainder else 0)
+    else:
+        person_totals = {}
+        remaining_tax_tip = tax_tip_total
 
-    sorted_keys = sorted(person_subtotals.keys())
-    for idx, key in enumerate(sorted_keys):
-        subtotal = person_subtotals[key]
-        person_totals[key] = subtotal
+        sorted_keys = sorted(person_subtotals.keys())
+        last_idx = len(sorted_keys) - 1
+        for idx, key in enumerate(sorted_keys):
+            subtotal = person_subtotals[key]
 
-        if regular_total > 0 and tax_tip_total > 0:
-            if idx == len(sorted_keys) - 1:
+            if idx == last_idx:
+                # Last person gets remainder to avoid rounding errors
                 tax_tip_share = remaining_tax_tip
             else:
-                tax_tip_share = int((subtotal / regular_total) * tax_tip_total)
+                # All-integer: no float conversion per person, and exact for
+                # cent amounts a double can't represent precisely.
+                tax_tip_share = subtotal * tax_tip_total // regular_total
                 remaining_tax_tip -= tax_tip_share
 
-            person_totals[key] += tax_tip_share
-
-    # Separate into user/group guest splits and expense guest amounts
-    splits = []
-    expense_guest_amounts = {}
-
-    for key, amount in person_totals.items():
-        if key.startswith("expense_guest_"):
-            # Expense guest - extract temp_id
-            temp_id = key.replace("expense_guest_", "")
-            expense_guest_amounts[temp_id] = amount
-        elif key.startswith("guest_"):
-            # Group guest
-            user_id = int(key.split("_")[1])
-            splits.append(schemas.ExpenseSplitBase(
-                user_id=user_id,
-                is_guest=True,
-                amount_owed=amount
-            ))
-        else:
-            # Registered user
-            user_id = int(key.split("_")[1])
-            splits.append(schemas.ExpenseSplitBase(
-                user_id=user_id,
-                is_guest=False,
-                amount_owed=amount
-            ))
+            person_totals[key] = subtotal + tax_tip_share
+
+    # Separate into user/group guest splits and expense guest amounts.
+    # Comprehensions over an append loop: the compiler emits LIST_APPEND
+    # with no per-iteration method lookup.
+    expense_guest_amounts = {
+        id_value: amount
+        for (kind, id_value), amount in person_totals.items()
+        if kind == "expense_guest"
+    }
+    splits = [
+        schemas.ExpenseSplitBase(
+            user_id=id_value,
+            is_guest=(kind == "guest"),
+            amount_owed=amount
+        )
+        for (kind, id_value), amount in person_totals.items()
+        if kind != "expense_guest"
+    ]
 
     return splits, expense_guest_amounts
@@ -47,7 +47,10 @@ import models
 from utils.balances import _detect_managed_cycles, _managed_key_for_guest
 from utils.currency import convert_currency, convert_to_usd
 from utils.dates import normalize_date
-from utils.display import get_participant_display_name
+from utils.display import (
+    get_participant_display_name,
+    get_participant_display_names_batch,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -443,71 +446,27 @@ def calculate_consumption_summary(
         )
 
     # ------------------------------------------------------------------
-    # Batch-prefetch display-name tables. Collect every (user_id, is_guest)
-    # key that will surface in the response — post-fold consumption rows and
-    # every managed-member breakdown entry — then issue at most two IN-list
-    # queries (``User`` + ``GuestMember``) instead of one SELECT per name.
+    # Batch-prefetch the display-name table. Collect every (user_id,
+    # is_guest) key that will surface in the response — post-fold consumption
+    # rows and every managed-member breakdown entry — and resolve them all
+    # with the shared batched helper (at most three IN-list queries) instead
+    # of one SELECT per name.
     # ------------------------------------------------------------------
-    all_user_ids: set = {uid for (uid, is_guest) in consumption.keys() if not is_guest}
-    all_guest_ids: set = {uid for (uid, is_guest) in consumption.keys() if is_guest}
+    all_keys = set(consumption.keys())
     for entries in manager_breakdown.values():
-        for (uid, is_guest), _ in entries:
-            if is_guest:
-                all_guest_ids.add(uid)
-            else:
-                all_user_ids.add(uid)
-
-    users_by_id: Dict[int, models.User] = {}
-    guests_by_id: Dict[int, models.GuestMember] = {}
-    if all_user_ids:
-        users_by_id = {
-            u.id: u
-            for u in db.query(models.User)
-            .filter(models.User.id.in_(all_user_ids))
-            .all()
-        }
-    if all_guest_ids:
-        guests_by_id = {
-            g.id: g
-            for g in db.query(models.GuestMember)
-            .filter(models.GuestMember.id.in_(all_guest_ids))
-            .all()
-        }
-
-    # Some claimed guests point at a User that's not already in
-    # ``users_by_id`` (e.g. the manager is a guest, so the claimed user never
-    # appears in ``consumption`` or breakdown keys). Fetch those too so
-    # ``resolve_name`` never falls back to a per-row query.
-    claimed_user_ids_to_fetch = {
-        g.claimed_by_id
-        for g in guests_by_id.values()
-        if g.claimed_by_id is not None and g.claimed_by_id not in users_by_id
-    }
-    if claimed_user_ids_to_fetch:
-        for u in (
-            db.query(models.User)
-            .filter(models.User.id.in_(claimed_user_ids_to_fetch))
-            .all()
-        ):
-            users_by_id[u.id] = u
+        for key, _ in entries:
+            all_keys.add(key)
+
+    display_names = get_participant_display_names_batch(all_keys, db)
 
     def resolve_name(user_id: int, is_guest: bool) -> str:
-        """Read from the prefetched dicts; fall back to the shared helper only
-        if a key is unexpectedly missing (shouldn't happen in practice)."""
-        if is_guest:
-            guest = guests_by_id.get(user_id)
-            if guest is None:
-                return get_participant_display_name(user_id, True, db)
-            if guest.claimed_by_id:
-                claimed_user = users_by_id.get(guest.claimed_by_id)
-                if claimed_user:
-                    return claimed_user.full_name or claimed_user.email
-                return guest.name
-            return guest.name
-        user = users_by_id.get(user_id)
-        if user is None:
-            return get_participant_display_name(user_id, False, db)
-        return user.full_name or user.email
+        """Read from the prefetched name table; fall back to the per-row
+        helper only if a key is unexpectedly missing (shouldn't happen in
+        practice)."""
+        name = display_names.get((user_id, is_guest))
+        if name is None:
+            return get_participant_display_name(user_id, is_guest, db)
+        return name
 
     # Now that names are resolvable, build the breakdown list shape the
     # dataclass expects.
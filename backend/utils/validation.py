@@ -9,27 +9,46 @@ import schemas
 
 
 def get_user_by_email(db: Session, email: str):
-    """Get a user by their email address."""
-    return db.query(models.User).filter(models.User.email == email).first()
+    """Get a user by their email address.
+
+    Found users are memoized on the session (db.info), which lives for one
+    request — auth and validation often look up the same email several
+    times per endpoint. Misses aren't cached so a user created later in
+    the same request is still found.
+    """
+    cache = db.info.setdefault("user_by_email_cache", {})
+    user = cache.get(email)
+    if user is None:
+        user = db.query(models.User).filter(models.User.email == email).first()
+        if user is not None:
+            cache[email] = user
+    return user
 
 
 def get_group_or_404(db: Session, group_id: int):
-    """Get a group by ID or raise 404 if not found."""
-    group = db.query(models.Group).filter(models.Group.id == group_id).first()
+    """Get a group by ID or raise 404 if not found.
+
+    Session.get serves repeat lookups from the identity map without
+    emitting SQL — handlers commonly resolve the same group for access
+    checks and again for the response.
+    """
+    group = db.get(models.Group, group_id)
     if not group:
         raise HTTPException(status_code=404, detail="Group not found")
     return group
 
 
-def verify_group_membership(db: Session, group_id: int, user_id: int):
-    """Verify that a user is a member of a group, raise 403 if not."""
-    member = db.query(models.GroupMember).filter(
-        models.GroupMember.group_id == group_id,
-        models.GroupMember.user_id == user_id
-    ).first()
-    if not member:
+def verify_group_membership(db: Session, group_id: int, user_id: int) -> None:
+    """Verify that a user is a member of a group, raise 403 if not.
+
+    Queries just the user_id column: an existence check doesn't need the
+    full GroupMember row hydrated through the identity map. Confirmed
+    memberships are memoized on the session for the request (endpoints
+    often check the same membership in several layers); negatives aren't
+    cached so a member added later in the request is still found.
+    """
+    if not is_group_member(db, group_id, user_id):
         raise HTTPException(status_code=403, detail="You are not a member of this group")
-    return member
 
 
 def verify_group_ownership(db: Session, group_id: int, user_id: int):
@@ -41,23 +60,92 @@ def verify_group_ownership(db: Session, group_id: int, user_id: int):
 
 
 def is_friend(db: Session, user_id1: int, user_id2: int) -> bool:
-    """Check if two users are friends."""
-    friendship = db.query(models.Friendship).filter(
-        or_(
-            and_(models.Friendship.user_id1 == user_id1, models.Friendship.user_id2 == user_id2),
-            and_(models.Friendship.user_id1 == user_id2, models.Friendship.user_id2 == user_id1)
-        )
+    """Check if two users are friends.
+
+    Friendship rows are stored in canonical order (user_id1 < user_id2;
+    see models.Friendship.canonical_pair and the canonicalize_friendships
+    migration), so one equality filter on the pair suffices.
+    """
+    lo, hi = models.Friendship.canonical_pair(user_id1, user_id2)
+    cache = db.info.setdefault("friend_pair_cache", set())
+    if (lo, hi) in cache:
+        return True
+    friendship = db.query(models.Friendship.user_id1).filter(
+        models.Friendship.user_id1 == lo,
+        models.Friendship.user_id2 == hi,
     ).first()
-    return friendship is not None
+    if friendship is None:
+        return False
+    cache.add((lo, hi))
+    return True
+
+
+def get_friend_ids(db: Session, user_id: int, other_user_ids: set[int] | None = None) -> set[int]:
+    """Get the ids of a user's friends as a set, in one bidirectional query.
+
+    Callers validating many participants should prefer this over repeated
+    is_friend calls. Pass other_user_ids to restrict the query to the ids
+    actually being checked.
+    """
+    query = db.query(models.Friendship.user_id1, models.Friendship.user_id2)
+    if other_user_ids is not None:
+        query = query.filter(
+            or_(
+                and_(
+                    models.Friendship.user_id1 == user_id,
+                    models.Friendship.user_id2.in_(other_user_ids),
+                ),
+                and_(
+                    models.Friendship.user_id2 == user_id,
+                    models.Friendship.user_id1.in_(other_user_ids),
+                ),
+            )
+        )
+    else:
+        query = query.filter(
+            or_(
+                models.Friendship.user_id1 == user_id,
+                models.Friendship.user_id2 == user_id,
+            )
+        )
+    return {
+        user_id2 if user_id1 == user_id else user_id1
+        for user_id1, user_id2 in query
+    }
 
 
 def is_group_member(db: Session, group_id: int, user_id: int) -> bool:
-    """Check if a user is a member of a group."""
-    member = db.query(models.GroupMember).filter(
+    """Check if a user is a member of a group.
+
+    Confirmed memberships are memoized on the session (db.info) like the
+    friendship pairs in is_friend; see verify_group_membership.
+    """
+    cache = db.info.setdefault("group_member_cache", set())
+    if (group_id, user_id) in cache:
+        return True
+    member = db.query(models.GroupMember.user_id).filter(
         models.GroupMember.group_id == group_id,
         models.GroupMember.user_id == user_id
     ).first()
-    return member is not None
+    if member is None:
+        return False
+    cache.add((group_id, user_id))
+    return True
+
+
+def get_group_member_ids(db: Session, group_id: int, user_ids: set[int] | None = None) -> set[int]:
+    """Get the user ids belonging to a group as a set, in one query.
+
+    Callers validating many participants should prefer this over repeated
+    is_group_member calls. Pass user_ids to restrict the query to the ids
+    actually being checked.
+    """
+    query = db.query(models.GroupMember.user_id).filter(
+        models.GroupMember.group_id == group_id
+    )
+    if user_ids is not None:
+        query = query.filter(models.GroupMember.user_id.in_(user_ids))
+    return {user_id for (user_id,) in query}
 
 
 def validate_expense_participants(
@@ -72,97 +160,158 @@ def validate_expense_participants(
 ) -> None:
     """Validate that all participants (payer, split participants, item assignees) exist and are authorized.
 
+    Issues a fixed number of batched IN queries (users, guests, memberships,
+    friendships) rather than one query per participant, then checks each
+    participant against the prefetched sets in the original order so the
+    error raised for a bad request is unchanged.
+
     Args:
         skip_expense_guest_validation: If True, skip validation for expense guests (they're created during expense creation)
         group_id: If provided, validates that all participants belong to this group.
         current_user_id: If provided (and group_id is None), validates that all participants are friends of this user.
     """
+    # Filter item assignments once up front (the id-gathering and the
+    # validation loop both need them): drop expense-guest assignments
+    # (temp_guest_id, or no user_id at all) where applicable.
+    relevant_assignments = [
+        assignment
+        for item in items or []
+        for assignment in item.assignments or []
+        if not (skip_expense_guest_validation and assignment.temp_guest_id)
+        and assignment.user_id is not None
+    ]
+
+    # Gather every referenced id up front
+    user_ids: set[int] = set()
+    guest_ids: set[int] = set()
+    (guest_ids if payer_is_guest else user_ids).add(payer_id)
+    for split in splits:
+        (guest_ids if split.is_guest else user_ids).add(split.user_id)
+    for assignment in relevant_assignments:
+        (guest_ids if assignment.is_guest else user_ids).add(assignment.user_id)
+
+    # Fast path: a personal (non-group) expense involving only the current
+    # user needs no lookups — they exist (they authenticated) and the
+    # friendship rules don't apply to oneself. Group expenses can't take
+    # this path: the membership check below is what authorizes them.
+    if (
+        not group_id
+        and current_user_id
+        and not payer_is_guest
+        and payer_id == current_user_id
+        and not guest_ids
+        and user_ids <= {current_user_id}
+    ):
+        return
+
+    # Batched lookups: existing users, each guest's group, and (depending on
+    # context) group memberships or friendships of the current user.
+    found_users = set()
+    if user_ids:
+        found_users = {
+            user_id
+            for (user_id,) in db.query(models.User.id).filter(models.User.id.in_(user_ids))
+        }
+
+    guest_group_by_id = {}
+    if guest_ids:
+        guest_group_by_id = dict(
+            db.query(models.GuestMember.id, models.GuestMember.group_id)
+            .filter(models.GuestMember.id.in_(guest_ids))
+        )
+
+    member_user_ids = set()
+    friend_user_ids = set()
+    accessible_group_ids = set()
+    if group_id:
+        if user_ids:
+            member_user_ids = get_group_member_ids(db, group_id, user_ids)
+    elif current_user_id:
+        other_user_ids = user_ids - {current_user_id}
+        if other_user_ids:
+            friend_user_ids = get_friend_ids(db, current_user_id, other_user_ids)
+
+        guest_group_ids = set(guest_group_by_id.values())
+        if guest_group_ids:
+            accessible_group_ids = {
+                member_group_id
+                for (member_group_id,) in db.query(models.GroupMember.group_id).filter(
+                    models.GroupMember.user_id == current_user_id,
+                    models.GroupMember.group_id.in_(guest_group_ids),
+                )
+            }
+
     # Validate payer
     if payer_is_guest:
-        payer = db.query(models.GuestMember).filter(models.GuestMember.id == payer_id).first()
-        if not payer:
+        if payer_id not in guest_group_by_id:
             raise HTTPException(status_code=400, detail=f"Guest payer with ID {payer_id} not found")
-        if group_id and payer.group_id != group_id:
+        if group_id and guest_group_by_id[payer_id] != group_id:
             raise HTTPException(status_code=400, detail=f"Guest payer with ID {payer_id} does not belong to group {group_id}")
     else:
-        payer = db.query(models.User).filter(models.User.id == payer_id).first()
-        if not payer:
+        if payer_id not in found_users:
             raise HTTPException(status_code=400, detail=f"User payer with ID {payer_id} not found")
 
         # Validation for group expense
         if group_id:
-            if not is_group_member(db, group_id, payer_id):
+            if payer_id not in member_user_ids:
                 raise HTTPException(status_code=400, detail=f"Payer with ID {payer_id} is not a member of the group")
 
         # Validation for non-group expense (Friendship check)
         elif current_user_id and payer_id != current_user_id:
-            if not is_friend(db, current_user_id, payer_id):
+            if payer_id not in friend_user_ids:
                 raise HTTPException(status_code=400, detail=f"Payer with ID {payer_id} is not a friend")
 
     # Validate split participants
     for split in splits:
         if split.is_guest:
-            guest = db.query(models.GuestMember).filter(models.GuestMember.id == split.user_id).first()
-            if not guest:
+            guest_group = guest_group_by_id.get(split.user_id)
+            if guest_group is None:
                 raise HTTPException(status_code=400, detail=f"Guest with ID {split.user_id} not found in splits")
 
             # Guest validation
-            if group_id and guest.group_id != group_id:
+            if group_id and guest_group != group_id:
                  raise HTTPException(status_code=400, detail=f"Guest with ID {split.user_id} does not belong to group {group_id}")
             elif not group_id and current_user_id:
                  # Ensure current user has access to this guest (must be in the same group)
-                 if not is_group_member(db, guest.group_id, current_user_id):
+                 if guest_group not in accessible_group_ids:
                      raise HTTPException(status_code=400, detail=f"You do not have access to guest with ID {split.user_id}")
         else:
-            user = db.query(models.User).filter(models.User.id == split.user_id).first()
-            if not user:
+            if split.user_id not in found_users:
                 raise HTTPException(status_code=400, detail=f"User with ID {split.user_id} not found in splits")
 
             # User validation
             if group_id:
-                if not is_group_member(db, group_id, split.user_id):
+                if split.user_id not in member_user_ids:
                     raise HTTPException(status_code=400, detail=f"User with ID {split.user_id} is not a member of the group")
             elif current_user_id and split.user_id != current_user_id:
-                if not is_friend(db, current_user_id, split.user_id):
+                if split.user_id not in friend_user_ids:
                     raise HTTPException(status_code=400, detail=f"User with ID {split.user_id} is not a friend")
 
     # Validate item assignments if provided
-    if items:
-        for item in items:
-            if item.assignments:
-                for assignment in item.assignments:
-                    # Skip expense guest assignments (they use temp_guest_id)
-                    if skip_expense_guest_validation and assignment.temp_guest_id:
-                        continue
-
-                    # Skip if no user_id (expense guest assignment)
-                    if assignment.user_id is None:
-                        continue
-
-                    if assignment.is_guest:
-                        guest = db.query(models.GuestMember).filter(models.GuestMember.id == assignment.user_id).first()
-                        if not guest:
-                            raise HTTPException(status_code=400, detail=f"Guest with ID {assignment.user_id} not found in item assignments")
-
-                        # Guest validation
-                        if group_id and guest.group_id != group_id:
-                             raise HTTPException(status_code=400, detail=f"Guest with ID {assignment.user_id} does not belong to group {group_id}")
-                        elif not group_id and current_user_id:
-                             if not is_group_member(db, guest.group_id, current_user_id):
-                                 raise HTTPException(status_code=400, detail=f"You do not have access to guest with ID {assignment.user_id}")
-
-                    else:
-                        user = db.query(models.User).filter(models.User.id == assignment.user_id).first()
-                        if not user:
-                            raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} not found in item assignments")
-
-                        # User validation
-                        if group_id:
-                            if not is_group_member(db, group_id, assignment.user_id):
-                                raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} is not a member of the group")
-                        elif current_user_id and assignment.user_id != current_user_id:
-                            if not is_friend(db, current_user_id, assignment.user_id):
-                                raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} is not a friend")
+    for assignment in relevant_assignments:
+        if assignment.is_guest:
+            guest_group = guest_group_by_id.get(assignment.user_id)
+            if guest_group is None:
+                raise HTTPException(status_code=400, detail=f"Guest with ID {assignment.user_id} not found in item assignments")
+
+            # Guest validation
+            if group_id and guest_group != group_id:
+                 raise HTTPException(status_code=400, detail=f"Guest with ID {assignment.user_id} does not belong to group {group_id}")
+            elif not group_id and current_user_id:
+                 if guest_group not in accessible_group_ids:
+                     raise HTTPException(status_code=400, detail=f"You do not have access to guest with ID {assignment.user_id}")
+
+        else:
+            if assignment.user_id not in found_users:
+                raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} not found in item assignments")
+
+            # User validation
+            if group_id:
+                if assignment.user_id not in member_user_ids:
+                    raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} is not a member of the group")
+            elif current_user_id and assignment.user_id != current_user_id:
+                if assignment.user_id not in friend_user_ids:
+                    raise HTTPException(status_code=400, detail=f"User with ID {assignment.user_id} is not a friend")
 
 
 def get_assignment_key(assignment: schemas.ItemAssignment) -> str:
@@ -175,14 +324,25 @@ def get_assignment_key(assignment: schemas.ItemAssignment) -> str:
         return f"user_{assignment.user_id}"
 
 
+# Which ItemSplitDetail field each split type validates, with the value
+# assumed when an assignment has no detail entry.
+_DETAIL_FIELDS = {
+    'EXACT': ('amount', 0),
+    'PERCENT': ('percentage', 0),
+    'SHARES': ('shares', 1),
+}
+
+
 def validate_item_split_details(items: list[schemas.ExpenseItemCreate]) -> None:
     """Validate that item split details are valid for their split types."""
-    for item_idx, item in enumerate(items):
-        if not hasattr(item, 'split_type'):
-            continue
+    # Most receipts are pure EQUAL splits (the default), which need no
+    # detail validation at all — skip the whole walk for them.
+    if not any(item.split_type != 'EQUAL' for item in items):
+        return
 
+    for item_idx, item in enumerate(items):
         split_type = item.split_type
-        split_details = getattr(item, 'split_details', {}) or {}
+        split_details = item.split_details
 
         # Skip validation for EQUAL splits
         if split_type == 'EQUAL' or len(item.assignments) <= 1:
@@ -195,21 +355,19 @@ def validate_item_split_details(items: list[schemas.ExpenseItemCreate]) -> None:
                 detail=f"Item {item_idx + 1}: Split details required for {split_type} split"
             )
 
-        # Validate EXACT splits
-        if split_type == 'EXACT':
-            total_amount = 0
-            for assignment in item.assignments:
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'amount'):
-                    amount = detail.amount or 0
-                elif isinstance(detail, dict):
-                    amount = detail.get('amount', 0)
-                else:
-                    amount = 0
-                total_amount += amount
+        # One extraction pass per item: pull the split type's field from
+        # each assignment's detail (split_details values are always
+        # ItemSplitDetail objects, enforced by the schema), then apply the
+        # type-specific total check below.
+        field, default = _DETAIL_FIELDS[split_type]
+        values = []
+        for assignment in item.assignments:
+            detail = split_details.get(get_assignment_key(assignment))
+            value = getattr(detail, field) if detail else None
+            values.append(default if value is None else value)
 
+        if split_type == 'EXACT':
+            total_amount = sum(values)
             # Allow small discrepancy for rounding
             if abs(total_amount - item.price) > len(item.assignments):
                 raise HTTPException(
@@ -217,21 +375,8 @@ def validate_item_split_details(items: list[schemas.ExpenseItemCreate]) -> None:
                     detail=f"Item {item_idx + 1}: Exact amounts (${total_amount/100:.2f}) don't match item price (${item.price/100:.2f})"
                 )
 
-        # Validate PERCENT splits
         elif split_type == 'PERCENT':
-            total_percentage = 0
-            for assignment in item.assignments:
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'percentage'):
-                    percentage = detail.percentage or 0
-                elif isinstance(detail, dict):
-                    percentage = detail.get('percentage', 0)
-                else:
-                    percentage = 0
-                total_percentage += percentage
-
+            total_percentage = sum(values)
             # Allow small discrepancy for rounding
             if abs(total_percentage - 100) > 0.01:
                 raise HTTPException(
@@ -239,27 +384,13 @@ def validate_item_split_details(items: list[schemas.ExpenseItemCreate]) -> None:
                     detail=f"Item {item_idx + 1}: Percentages must add up to 100% (currently {total_percentage}%)"
                 )
 
-        # Validate SHARES splits
         elif split_type == 'SHARES':
-            total_shares = 0
-            for assignment in item.assignments:
-                key = get_assignment_key(assignment)
-                detail = split_details.get(key, {})
-                # Handle both dict and ItemSplitDetail object
-                if hasattr(detail, 'shares'):
-                    shares = detail.shares if detail.shares is not None else 1
-                elif isinstance(detail, dict):
-                    shares = detail.get('shares', 1)
-                else:
-                    shares = 1
-                if shares < 1:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Item {item_idx + 1}: Shares must be at least 1"
-                    )
-                total_shares += shares
-
-            if total_shares == 0:
+            if any(shares < 1 for shares in values):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Item {item_idx + 1}: Shares must be at least 1"
+                )
+            if sum(values) == 0:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Item {item_idx + 1}: Total shares must be greater than 0"